@@ -8,7 +8,11 @@ APPS_DIR = os.path.join(OUR_DIR, 'apps')
 sys.path.insert(0, APPS_DIR)
 
 from django.core.wsgi import get_wsgi_application
+from health.wsgi_shortcut import HealthShortcut
 
 os.environ["DJANGO_SETTINGS_MODULE"] = "mainsite.settings_local"
 
-application = get_wsgi_application()
\ No newline at end of file
+application = get_wsgi_application()
+
+# answer load balancer health checks without going through django's request handling
+application = HealthShortcut(application)
\ No newline at end of file
@@ -1,11 +1,14 @@
 # encoding: utf-8
 from __future__ import unicode_literals
 
-from django.conf.urls import url
+from django.urls import path
 
 from backpack.badge_connect_api import BadgeConnectProfileView, BadgeConnectAssertionListView
+from mainsite.urlutils import precompile_urlpatterns
 
 urlpatterns = [
-    url(r'^assertions$', BadgeConnectAssertionListView.as_view(), name='bc_api_backpack_assertion_list'),
-    url(r'^profile$', BadgeConnectProfileView.as_view(), name='bc_api_profile'),
-]
\ No newline at end of file
+    path('assertions', BadgeConnectAssertionListView.as_view(), name='bc_api_backpack_assertion_list'),
+    path('profile', BadgeConnectProfileView.as_view(), name='bc_api_profile'),
+]
+
+precompile_urlpatterns(urlpatterns)
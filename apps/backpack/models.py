@@ -6,7 +6,6 @@ from collections import OrderedDict
 
 import cachemodel
 from basic_models.models import CreatedUpdatedAt
-from django.urls import reverse
 from django.db import models, transaction
 from django.db.models import Q
 
@@ -17,6 +16,7 @@ from issuer.utils import CURRENT_OBI_VERSION, get_obi_context, add_obi_version_i
 from mainsite.managers import SlugOrJsonIdCacheModelManager
 from mainsite.models import BadgrApp
 from mainsite.utils import OriginSetting
+from mainsite.urlutils import cached_reverse
 
 
 class BackpackCollection(BaseAuditedModelDeletedWithUser, BaseVersionedEntity):
@@ -84,7 +84,7 @@ class BackpackCollection(BaseAuditedModelDeletedWithUser, BaseVersionedEntity):
     @property
     def share_url(self):
         if self.published:
-            return OriginSetting.HTTP+reverse('collection_json', kwargs={'entity_id': self.share_hash})
+            return OriginSetting.HTTP+cached_reverse('collection_json', self.share_hash)
 
     def get_share_url(self, **kwargs):
         return self.share_url
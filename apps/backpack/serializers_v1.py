@@ -2,7 +2,6 @@ import datetime
 from collections import OrderedDict
 
 from django.core.exceptions import ValidationError as DjangoValidationError
-from django.urls import reverse
 from django.utils.dateparse import parse_datetime, parse_date
 from rest_framework import serializers
 from rest_framework.exceptions import ValidationError as RestframeworkValidationError
@@ -16,6 +15,7 @@ from issuer.serializers_v1 import EvidenceItemSerializer
 from mainsite.drf_fields import Base64FileField
 from mainsite.serializers import StripTagsCharField, MarkdownCharField
 from mainsite.utils import OriginSetting
+from mainsite.urlutils import cached_reverse
 
 logger = badgrlog.BadgrLogger()
 
@@ -58,12 +58,12 @@ class LocalBadgeInstanceUploadSerializerV1(serializers.Serializer):
         representation['json'] = V1BadgeInstanceSerializer(obj, context=self.context).data
         representation['imagePreview'] = {
             "type": "image",
-            "id": "{}{}?type=png".format(OriginSetting.HTTP, reverse('badgeclass_image', kwargs={'entity_id': obj.cached_badgeclass.entity_id}))
+            "id": "{}{}?type=png".format(OriginSetting.HTTP, cached_reverse('badgeclass_image', obj.cached_badgeclass.entity_id))
         }
         if obj.cached_issuer.image:
             representation['issuerImagePreview'] = {
                 "type": "image",
-                "id": "{}{}?type=png".format(OriginSetting.HTTP, reverse('issuer_image', kwargs={'entity_id': obj.cached_issuer.entity_id}))
+                "id": "{}{}?type=png".format(OriginSetting.HTTP, cached_reverse('issuer_image', obj.cached_issuer.entity_id))
             }
 
         if obj.image:
@@ -1,14 +1,17 @@
-from django.conf.urls import url
+from django.urls import path, re_path
 
-from backpack.views import LegacyBadgeShareRedirectView, RedirectSharedCollectionView, LegacyCollectionShareRedirectView
+from backpack.views import legacy_badge_share_redirect, redirect_shared_collection, legacy_collection_share_redirect
+from mainsite.urlutils import precompile_urlpatterns
 
 urlpatterns = [
     # legacy redirects
 
-    url(r'^share/?collection/(?P<share_hash>[^/]+)(/embed)?$', RedirectSharedCollectionView.as_view(), name='redirect_backpack_shared_collection'),
-    url(r'^share/?badge/(?P<share_hash>[^/]+)$', LegacyBadgeShareRedirectView.as_view(), name='legacy_redirect_backpack_shared_badge'),
+    re_path(r'^share/?collection/(?P<share_hash>[-a-zA-Z0-9_]+)$', redirect_shared_collection, name='redirect_backpack_shared_collection'),
+    re_path(r'^share/?collection/(?P<share_hash>[-a-zA-Z0-9_]+)/embed$', redirect_shared_collection, name='redirect_backpack_shared_collection_embed'),
+    re_path(r'^share/?badge/(?P<share_hash>[-a-zA-Z0-9_]+)$', legacy_badge_share_redirect, name='legacy_redirect_backpack_shared_badge'),
 
-    url(r'^earner/collections/(?P<pk>[^/]+)/(?P<share_hash>[^/]+)$', LegacyCollectionShareRedirectView.as_view(), name='legacy_shared_collection'),
-    url(r'^earner/collections/(?P<pk>[^/]+)/(?P<share_hash>[^/]+)/embed$', LegacyCollectionShareRedirectView.as_view(), name='legacy_shared_collection_embed'),
+    path('earner/collections/<str:pk>/<slug:share_hash>', legacy_collection_share_redirect, name='legacy_shared_collection'),
+    path('earner/collections/<str:pk>/<slug:share_hash>/embed', legacy_collection_share_redirect, name='legacy_shared_collection_embed'),
 ]
 
+precompile_urlpatterns(urlpatterns)
@@ -1,5 +1,4 @@
 import base64
-import collections
 import datetime
 import json
 import os
@@ -943,8 +942,8 @@ class TestExpandAssertions(BadgrTestCase, SetupIssuerHelper):
         response = self.client.get('/v2/backpack/assertions')
 
         self.assertEqual(response.status_code, 200)
-        # checking if 'badgeclass' was expanded into a dictionary
-        self.assertTrue(not isinstance(response.data['result'][0]['badgeclass'], collections.OrderedDict))
+        # 'badgeclass' is left as its id, not expanded into a dictionary
+        self.assertTrue(isinstance(response.data['result'][0]['badgeclass'], str))
 
         fid = response.data['result'][0]['entityId']
         response = self.client.get('/v2/backpack/assertions/{}'.format(fid))
@@ -964,8 +963,8 @@ class TestExpandAssertions(BadgrTestCase, SetupIssuerHelper):
         response = self.client.get('/v2/backpack/assertions?expand=badgeclass')
 
         self.assertEqual(response.status_code, 200)
-        self.assertTrue(isinstance(response.data['result'][0]['badgeclass'], collections.OrderedDict))
-        self.assertTrue(not isinstance(response.data['result'][0]['badgeclass']['issuer'], collections.OrderedDict))
+        self.assertTrue(isinstance(response.data['result'][0]['badgeclass'], dict))
+        self.assertTrue(isinstance(response.data['result'][0]['badgeclass']['issuer'], str))
 
         fid = response.data['result'][0]['entityId']
         response = self.client.get('/v2/backpack/assertions/{}?expand=badgeclass&expand=issuer'.format(fid))
@@ -1004,8 +1003,8 @@ class TestExpandAssertions(BadgrTestCase, SetupIssuerHelper):
         response = self.client.get('/v2/backpack/assertions?expand=badgeclass&expand=issuer')
 
         self.assertEqual(response.status_code, 200)
-        self.assertTrue(isinstance(response.data['result'][0]['badgeclass'], collections.OrderedDict))
-        self.assertTrue(isinstance(response.data['result'][0]['badgeclass']['issuer'], collections.OrderedDict))
+        self.assertTrue(isinstance(response.data['result'][0]['badgeclass'], dict))
+        self.assertTrue(isinstance(response.data['result'][0]['badgeclass']['issuer'], dict))
 
     def test_expand_badgeclass_mult_assertions_mult_issuers(self):
         '''For a client with multiple badges, attempting to expand the badgeclass without
@@ -1037,8 +1036,8 @@ class TestExpandAssertions(BadgrTestCase, SetupIssuerHelper):
 
         self.assertEqual(len(response.data['result']), 6)
         for i in range(6):
-            self.assertTrue(isinstance(response.data['result'][i]['badgeclass'], collections.OrderedDict))
-            self.assertTrue(not isinstance(response.data['result'][i]['badgeclass']['issuer'], collections.OrderedDict))
+            self.assertTrue(isinstance(response.data['result'][i]['badgeclass'], dict))
+            self.assertTrue(isinstance(response.data['result'][i]['badgeclass']['issuer'], str))
 
     def test_expand_badgeclass_and_issuer_mult_assertions_mult_issuers(self):
         '''For a client with multiple badges, attempting to expand the badgeclass and issuer.'''
@@ -1069,8 +1068,8 @@ class TestExpandAssertions(BadgrTestCase, SetupIssuerHelper):
 
         self.assertEqual(len(response.data['result']), 6)
         for i in range(6):
-            self.assertTrue(isinstance(response.data['result'][i]['badgeclass'], collections.OrderedDict))
-            self.assertTrue(isinstance(response.data['result'][i]['badgeclass']['issuer'], collections.OrderedDict))
+            self.assertTrue(isinstance(response.data['result'][i]['badgeclass'], dict))
+            self.assertTrue(isinstance(response.data['result'][i]['badgeclass']['issuer'], dict))
 
 
 class TestPendingBadges(BadgrTestCase, SetupIssuerHelper):
@@ -1,24 +1,27 @@
-from django.conf.urls import url
+from django.urls import path
 
 from backpack.api import BackpackAssertionList, BackpackAssertionDetail, BackpackAssertionDetailImage, \
     BackpackCollectionList, BackpackCollectionDetail, ShareBackpackAssertion, ShareBackpackCollection
 from backpack.api_v1 import CollectionLocalBadgeInstanceList, CollectionLocalBadgeInstanceDetail, \
     CollectionGenerateShare
+from mainsite.urlutils import precompile_urlpatterns
 
 urlpatterns = [
 
-    url(r'^badges$', BackpackAssertionList.as_view(), name='v1_api_localbadgeinstance_list'),
-    url(r'^badges/(?P<slug>[^/]+)$', BackpackAssertionDetail.as_view(), name='v1_api_localbadgeinstance_detail'),
-    url(r'^badges/(?P<slug>[^/]+)/image$', BackpackAssertionDetailImage.as_view(), name='v1_api_localbadgeinstance_image'),
+    path('badges', BackpackAssertionList.as_view(), name='v1_api_localbadgeinstance_list'),
+    path('badges/<str:slug>', BackpackAssertionDetail.as_view(), name='v1_api_localbadgeinstance_detail'),
+    path('badges/<str:slug>/image', BackpackAssertionDetailImage.as_view(), name='v1_api_localbadgeinstance_image'),
 
-    url(r'^collections$', BackpackCollectionList.as_view(), name='v1_api_collection_list'),
-    url(r'^collections/(?P<slug>[-\w]+)$', BackpackCollectionDetail.as_view(), name='v1_api_collection_detail'),
+    path('collections', BackpackCollectionList.as_view(), name='v1_api_collection_list'),
+    path('collections/<slug:slug>', BackpackCollectionDetail.as_view(), name='v1_api_collection_detail'),
 
     # legacy v1 endpoints
-    url(r'^collections/(?P<slug>[-\w]+)/badges$', CollectionLocalBadgeInstanceList.as_view(), name='v1_api_collection_badges'),
-    url(r'^collections/(?P<collection_slug>[-\w]+)/badges/(?P<slug>[^/]+)$', CollectionLocalBadgeInstanceDetail.as_view(), name='v1_api_collection_localbadgeinstance_detail'),
-    url(r'^collections/(?P<slug>[-\w]+)/share$', CollectionGenerateShare.as_view(), name='v1_api_collection_generate_share'),
+    path('collections/<slug:slug>/badges', CollectionLocalBadgeInstanceList.as_view(), name='v1_api_collection_badges'),
+    path('collections/<slug:collection_slug>/badges/<str:slug>', CollectionLocalBadgeInstanceDetail.as_view(), name='v1_api_collection_localbadgeinstance_detail'),
+    path('collections/<slug:slug>/share', CollectionGenerateShare.as_view(), name='v1_api_collection_generate_share'),
 
-    url(r'^share/badge/(?P<slug>[^/]+)$', ShareBackpackAssertion.as_view(), name='v1_api_analytics_share_badge'),
-    url(r'^share/collection/(?P<slug>[^/]+)$', ShareBackpackCollection.as_view(), name='v1_api_analytics_share_collection'),
+    path('share/badge/<str:slug>', ShareBackpackAssertion.as_view(), name='v1_api_analytics_share_badge'),
+    path('share/collection/<str:slug>', ShareBackpackCollection.as_view(), name='v1_api_analytics_share_collection'),
 ]
+
+precompile_urlpatterns(urlpatterns)
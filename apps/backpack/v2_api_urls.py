@@ -1,24 +1,25 @@
 # encoding: utf-8
 
 
-from django.conf.urls import url
+from django.urls import path
 
 from backpack.api import BackpackAssertionList, BackpackAssertionDetail, BackpackCollectionList, \
     BackpackCollectionDetail, BackpackAssertionDetailImage, BackpackImportBadge, ShareBackpackCollection, \
-    ShareBackpackAssertion, BadgesFromUser
+    ShareBackpackAssertion
+from mainsite.urlutils import precompile_urlpatterns
 
 urlpatterns = [
-    url(r'^import$', BackpackImportBadge.as_view(), name='v2_api_backpack_import_badge'),
+    path('import', BackpackImportBadge.as_view(), name='v2_api_backpack_import_badge'),
 
-    url(r'^assertions$', BackpackAssertionList.as_view(), name='v2_api_backpack_assertion_list'),
-    url(r'^assertions/(?P<entity_id>[^/]+)$', BackpackAssertionDetail.as_view(), name='v2_api_backpack_assertion_detail'),
-    url(r'^assertions/(?P<entity_id>[^/]+)/image$', BackpackAssertionDetailImage.as_view(), name='v2_api_backpack_assertion_detail_image'),
+    path('assertions', BackpackAssertionList.as_view(), name='v2_api_backpack_assertion_list'),
+    path('assertions/<slug:entity_id>', BackpackAssertionDetail.as_view(), name='v2_api_backpack_assertion_detail'),
+    path('assertions/<slug:entity_id>/image', BackpackAssertionDetailImage.as_view(), name='v2_api_backpack_assertion_detail_image'),
 
-    url(r'^collections$', BackpackCollectionList.as_view(), name='v2_api_backpack_collection_list'),
-    url(r'^collections/(?P<entity_id>[^/]+)$', BackpackCollectionDetail.as_view(), name='v2_api_backpack_collection_detail'),
+    path('collections', BackpackCollectionList.as_view(), name='v2_api_backpack_collection_list'),
+    path('collections/<slug:entity_id>', BackpackCollectionDetail.as_view(), name='v2_api_backpack_collection_detail'),
 
-    url(r'^share/assertion/(?P<entity_id>[^/]+)$', ShareBackpackAssertion.as_view(), name='v2_api_share_assertion'),
-    url(r'^share/collection/(?P<entity_id>[^/]+)$', ShareBackpackCollection.as_view(), name='v2_api_share_collection'),
+    path('share/assertion/<slug:entity_id>', ShareBackpackAssertion.as_view(), name='v2_api_share_assertion'),
+    path('share/collection/<slug:entity_id>', ShareBackpackCollection.as_view(), name='v2_api_share_collection'),
+]
 
-    url(r'^(?P<email>[^/]+)$', BadgesFromUser().as_view(), name='v2_api_badges_from_user'),
-]
\ No newline at end of file
+precompile_urlpatterns(urlpatterns)
@@ -0,0 +1,13 @@
+# encoding: utf-8
+
+
+from django.urls import re_path
+
+from backpack.api import BadgesFromUser
+from mainsite.urlutils import precompile_urlpatterns
+
+urlpatterns = [
+    re_path(r'^(?P<email>[^/@\s]+@[^/@\s]+)$', BadgesFromUser.as_view(), name='v2_api_badges_from_user'),
+]
+
+precompile_urlpatterns(urlpatterns)
@@ -1,23 +1,28 @@
 # encoding: utf-8
 
 
-from django.conf.urls import url
+from django.urls import path, re_path
 
 from badgeuser.api import (BadgeUserAccountConfirm, BadgeUserToken, BadgeUserForgotPassword, BadgeUserEmailConfirm,
                            BadgeUserDetail, AccessTokenList, AccessTokenDetail, LatestTermsVersionDetail,)
+from mainsite.urlutils import precompile_urlpatterns
+
+user_detail_view = BadgeUserDetail.as_view()
 
 urlpatterns = [
 
-    url(r'^auth/token$', BadgeUserToken.as_view(), name='v2_api_auth_token'),
-    url(r'^auth/forgot-password$', BadgeUserForgotPassword.as_view(), name='v2_api_auth_forgot_password'),
-    url(r'^auth/confirm-email/(?P<confirm_id>[^/]+)$', BadgeUserEmailConfirm.as_view(), name='v2_api_auth_confirm_email'),
-    url(r'^auth/confirm-account/(?P<authcode>[^/]+)$', BadgeUserAccountConfirm.as_view(), name='v2_api_account_confirm'),
+    path('auth/token', BadgeUserToken.as_view(), name='v2_api_auth_token'),
+    path('auth/forgot-password', BadgeUserForgotPassword.as_view(), name='v2_api_auth_forgot_password'),
+    path('auth/confirm-email/<str:confirm_id>', BadgeUserEmailConfirm.as_view(), name='v2_api_auth_confirm_email'),
+    path('auth/confirm-account/<str:authcode>', BadgeUserAccountConfirm.as_view(), name='v2_api_account_confirm'),
+
+    path('auth/tokens', AccessTokenList.as_view(), name='v2_api_access_token_list'),
+    path('auth/tokens/<slug:entity_id>', AccessTokenDetail.as_view(), name='v2_api_access_token_detail'),
 
-    url(r'^auth/tokens$', AccessTokenList.as_view(), name='v2_api_access_token_list'),
-    url(r'^auth/tokens/(?P<entity_id>[^/]+)$', AccessTokenDetail.as_view(), name='v2_api_access_token_detail'),
+    re_path(r'^users/(?P<entity_id>self)$', user_detail_view, name='v2_api_user_self'),
+    path('users/<slug:entity_id>', user_detail_view, name='v2_api_user_detail'),
 
-    url(r'^users/(?P<entity_id>self)$', BadgeUserDetail.as_view(), name='v2_api_user_self'),
-    url(r'^users/(?P<entity_id>[^/]+)$', BadgeUserDetail.as_view(), name='v2_api_user_detail'),
+    path('termsVersions/latest', LatestTermsVersionDetail.as_view(), name='v2_latest_terms_version_detail'),
+]
 
-    url(r'^termsVersions/latest$', LatestTermsVersionDetail.as_view(), name='v2_latest_terms_version_detail'),
-]
\ No newline at end of file
+precompile_urlpatterns(urlpatterns)
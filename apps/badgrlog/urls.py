@@ -1,7 +1,11 @@
-from django.conf.urls import url
+from django.urls import path
 
-from .views import BadgrLogContextView
+from mainsite.urlutils import precompile_urlpatterns
+
+from .views import badgr_log_context
 
 urlpatterns = [
-    url(r'^v1$', BadgrLogContextView.as_view(), name='badgr_log_context'),
+    path('v1', badgr_log_context, name='badgr_log_context'),
 ]
+
+precompile_urlpatterns(urlpatterns)
@@ -1,39 +1,43 @@
-from rest_framework.response import Response
-from rest_framework.views import APIView
-
-
-class BadgrLogContextView(APIView):
-    permission_classes = []
-    def get(self, request):
-
-        return Response(
-            {
-                "@context": [
-                    "https://w3id.org/openbadges/v1",
-                    {
-                        "sioc": "http://rdfs.org/sioc/ns#",
-                        "badgeInstance": "obi:assertion",
-                        "badgeClass": "obi:badge",
-
-                        "Action": "schema:action",
-                        "Image": "schema:ImageObject",
-
-                        "timestamp": "schema:endTime",
-                        "user": "schema:agent",
-                        "ipAddress": "sioc:ip_address",
-                        "username": "sioc:name",
-                        "givenName": "schema:givenName",
-                        "familyName": "schema:familyName",
-                        "notification": "http://www.w3.org/ns/odrl/2/deliveryChannel",
-
-                        "results": "obi:TBD",
-                        "error": "obi:TBD",
-                        "creator": "obi:TBD",
-                        "size": "obi:TBD",
-                        "fileType": "obi:TBD",
-                        "actionType": "obi:TBD"
-
-                    }
-                ]
-            }
-        )
+import json
+
+from django.http import HttpResponse
+from django.views.decorators.http import require_safe
+
+
+BADGR_LOG_CONTEXT = {
+    "@context": [
+        "https://w3id.org/openbadges/v1",
+        {
+            "sioc": "http://rdfs.org/sioc/ns#",
+            "badgeInstance": "obi:assertion",
+            "badgeClass": "obi:badge",
+
+            "Action": "schema:action",
+            "Image": "schema:ImageObject",
+
+            "timestamp": "schema:endTime",
+            "user": "schema:agent",
+            "ipAddress": "sioc:ip_address",
+            "username": "sioc:name",
+            "givenName": "schema:givenName",
+            "familyName": "schema:familyName",
+            "notification": "http://www.w3.org/ns/odrl/2/deliveryChannel",
+
+            "results": "obi:TBD",
+            "error": "obi:TBD",
+            "creator": "obi:TBD",
+            "size": "obi:TBD",
+            "fileType": "obi:TBD",
+            "actionType": "obi:TBD"
+
+        }
+    ]
+}
+
+# the context never changes, so serialize it once rather than rendering it on every request
+BADGR_LOG_CONTEXT_JSON = json.dumps(BADGR_LOG_CONTEXT).encode('utf-8')
+
+
+@require_safe
+def badgr_log_context(request):
+    return HttpResponse(BADGR_LOG_CONTEXT_JSON, content_type='application/json')
@@ -37,17 +37,23 @@ from saml2.s_utils import MissingValue
 
 
 class SAML2Tests(BadgrTestCase):
+    test_files_path = os.path.join(TOP_DIR, 'apps', 'badgrsocialauth', 'testfiles')
+    idp_metadata_for_sp_config_path = os.path.join(test_files_path, 'idp-metadata-for-saml2configuration.xml')
+    ipd_cert_path = os.path.join(test_files_path, 'idp-test-cert.pem')
+    ipd_key_path = os.path.join(test_files_path, 'idp-test-key.pem')
+
+    @classmethod
+    def setUpClass(cls):
+        super(SAML2Tests, cls).setUpClass()
+        with open(cls.idp_metadata_for_sp_config_path, 'r') as f:
+            cls.idp_metadata_xml = f.read()
+
     def setUp(self):
         super(SAML2Tests, self).setUp()
-        self.test_files_path = os.path.join(TOP_DIR, 'apps', 'badgrsocialauth', 'testfiles')
-        self.idp_metadata_for_sp_config_path = os.path.join(self.test_files_path, 'idp-metadata-for-saml2configuration.xml')
-
-        with open(self.idp_metadata_for_sp_config_path, 'r') as f:
-            metadata_xml = f.read()
         self.config = Saml2Configuration.objects.create(
             metadata_conf_url="http://example.com",
             slug="saml2.test",
-            cached_metadata=metadata_xml
+            cached_metadata=self.idp_metadata_xml
         )
         self.badgr_app = BadgrApp.objects.create(
             ui_login_redirect="https://example.com",
@@ -55,8 +61,6 @@ class SAML2Tests(BadgrTestCase):
         )
         self.badgr_app.is_default = True
         self.badgr_app.save()
-        self.ipd_cert_path = os.path.join(self.test_files_path, 'idp-test-cert.pem')
-        self.ipd_key_path = os.path.join(self.test_files_path, 'idp-test-key.pem')
         self.sp_acs_location = 'http://localhost:8000/account/saml2/{}/acs/'.format(self.config.slug)
 
     def _skip_if_xmlsec_binary_missing(self):
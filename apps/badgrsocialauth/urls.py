@@ -8,6 +8,7 @@ from django.conf.urls import url
 from badgrsocialauth.views import BadgrSocialLogin, BadgrSocialEmailExists, BadgrSocialAccountVerifyEmail, \
     BadgrSocialLoginCancel, BadgrAccountConnected, assertion_consumer_service, saml2_render_or_redirect, \
     saml2_sp_metadata, SamlEmailExistsRedirect, SamlFailureRedirect, SamlProvisionRedirect, SamlSuccessRedirect
+from mainsite.urlutils import precompile_urlpatterns
 
 urlpatterns = [
     url(r'^sociallogin', BadgrSocialLogin.as_view(permanent=False), name='socialaccount_login'),
@@ -47,3 +48,5 @@ for provider in [p for p in provider_list if p.id in configured_providers]:
     prov_urlpatterns = getattr(prov_mod, 'urlpatterns', None)
     if prov_urlpatterns:
         urlpatterns += prov_urlpatterns
+
+precompile_urlpatterns(urlpatterns)
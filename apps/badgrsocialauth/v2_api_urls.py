@@ -1,9 +1,12 @@
-from django.conf.urls import url
+from django.urls import path
 
 from badgrsocialauth.api import BadgrSocialAccountList, BadgrSocialAccountDetail, BadgrSocialAccountConnect
+from mainsite.urlutils import precompile_urlpatterns
 
 urlpatterns = [
-    url(r'^socialaccounts$', BadgrSocialAccountList.as_view(), name='v2_api_user_socialaccount_list'),
-    url(r'^socialaccounts/connect$', BadgrSocialAccountConnect.as_view(), name='v2_api_user_socialaccount_connect'),
-    url(r'^socialaccounts/(?P<id>[^/]+)$', BadgrSocialAccountDetail.as_view(), name='v2_api_user_socialaccount_detail')
+    path('socialaccounts', BadgrSocialAccountList.as_view(), name='v2_api_user_socialaccount_list'),
+    path('socialaccounts/connect', BadgrSocialAccountConnect.as_view(), name='v2_api_user_socialaccount_connect'),
+    path('socialaccounts/<str:id>', BadgrSocialAccountDetail.as_view(), name='v2_api_user_socialaccount_detail')
 ]
+
+precompile_urlpatterns(urlpatterns)
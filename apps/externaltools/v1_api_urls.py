@@ -1,11 +1,14 @@
 # encoding: utf-8
 
 
-from django.conf.urls import url
+from django.urls import path
 
 from externaltools.api import ExternalToolList, ExternalToolLaunch
+from mainsite.urlutils import precompile_urlpatterns
 
 urlpatterns = [
-    url(r'^$', ExternalToolList.as_view(), name='v1_api_externaltools_list'),
-    url(r'^launch/(?P<slug>[^/]+)/(?P<launchpoint>[^/]+)$', ExternalToolLaunch.as_view(), name='v1_api_externaltools_launch'),
-]
\ No newline at end of file
+    path('', ExternalToolList.as_view(), name='v1_api_externaltools_list'),
+    path('launch/<str:slug>/<str:launchpoint>', ExternalToolLaunch.as_view(), name='v1_api_externaltools_launch'),
+]
+
+precompile_urlpatterns(urlpatterns)
@@ -1,11 +1,14 @@
 # encoding: utf-8
 
 
-from django.conf.urls import url
+from django.urls import path
 
 from externaltools.api import ExternalToolList, ExternalToolLaunch
+from mainsite.urlutils import precompile_urlpatterns
 
 urlpatterns = [
-    url(r'^$', ExternalToolList.as_view(), name='v2_api_externaltools_list'),
-    url(r'^launch/(?P<entity_id>[^/]+)/(?P<launchpoint>[^/]+)$', ExternalToolLaunch.as_view(), name='v2_api_externaltools_launch'),
+    path('', ExternalToolList.as_view(), name='v2_api_externaltools_list'),
+    path('launch/<str:entity_id>/<str:launchpoint>', ExternalToolLaunch.as_view(), name='v2_api_externaltools_launch'),
 ]
+
+precompile_urlpatterns(urlpatterns)
@@ -0,0 +1,70 @@
+import json
+
+import mock
+
+from health.views import get_health_status
+from health.wsgi_shortcut import HealthShortcut
+from mainsite.tests import BadgrTestCase
+
+
+class HealthShortcutTests(BadgrTestCase):
+    def setUp(self):
+        super(HealthShortcutTests, self).setUp()
+        self.wrapped_app = mock.Mock(return_value=[b'from django'])
+        self.app = HealthShortcut(self.wrapped_app)
+
+    def call(self, path='/health', method='GET'):
+        start_response = mock.Mock()
+        body = b''.join(self.app({'PATH_INFO': path, 'REQUEST_METHOD': method}, start_response))
+        start_response.assert_called_once()
+        status, headers = start_response.call_args[0]
+        return status, dict(headers), body
+
+    def test_healthy(self):
+        status, headers, body = self.call()
+        self.assertEqual(status, '200 OK')
+        self.assertEqual(json.loads(body.decode('utf-8')), get_health_status())
+        self.assertEqual(json.loads(body.decode('utf-8'))['overall_status'], 'OK')
+        self.assertEqual(headers['Content-Type'], 'application/json')
+        self.assertEqual(headers['Content-Length'], str(len(body)))
+        self.wrapped_app.assert_not_called()
+
+    def test_matches_the_django_view(self):
+        status, headers, body = self.call()
+        response = self.client.get('/health')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(json.loads(body.decode('utf-8')), response.json())
+
+    def test_unavailable(self):
+        unavailable = {
+            'overall_status': 'UNAVAILABLE',
+            'detailed_status': {'database_status': 'UNAVAILABLE'}
+        }
+        with mock.patch('health.wsgi_shortcut.get_health_status', return_value=unavailable):
+            status, headers, body = self.call()
+        self.assertEqual(status, '503 Service Unavailable')
+        self.assertEqual(json.loads(body.decode('utf-8')), unavailable)
+        self.assertEqual(headers['Content-Length'], str(len(body)))
+        self.wrapped_app.assert_not_called()
+
+    def test_head(self):
+        status, headers, body = self.call(method='HEAD')
+        self.assertEqual(status, '200 OK')
+        self.assertEqual(headers['Content-Length'], str(len(body)))
+        self.wrapped_app.assert_not_called()
+
+    def test_other_methods_pass_through(self):
+        for method in ('POST', 'PUT', 'DELETE', 'OPTIONS'):
+            start_response = mock.Mock()
+            environ = {'PATH_INFO': '/health', 'REQUEST_METHOD': method}
+            self.assertEqual(self.app(environ, start_response), [b'from django'])
+            self.wrapped_app.assert_called_with(environ, start_response)
+            start_response.assert_not_called()
+
+    def test_other_paths_pass_through(self):
+        for path in ('/', '/health/', '/healthz', '/v2/issuers'):
+            start_response = mock.Mock()
+            environ = {'PATH_INFO': path, 'REQUEST_METHOD': 'GET'}
+            self.assertEqual(self.app(environ, start_response), [b'from django'])
+            self.wrapped_app.assert_called_with(environ, start_response)
+            start_response.assert_not_called()
@@ -1,7 +1,11 @@
-from django.conf.urls import url
+from django.urls import path
+
+from mainsite.urlutils import precompile_urlpatterns
 
 from .views import health
 
 urlpatterns = [
-    url(r'^$', health, name='server_health'),
+    path('', health, name='server_health'),
 ]
+
+precompile_urlpatterns(urlpatterns)
@@ -15,23 +15,12 @@ OK = 'OK'
 UNAVAILABLE = 'UNAVAILABLE'
 
 
-def health(req):
+def get_health_status():
     """
-    Allows a load balancer to verify that the badges service is up and OK.
-
-    Integrate checks on the database and any other service that this application depends on.
+    Check the services this application depends on.
 
     Returns:
-        HttpResponse: 200 if the badges service is available, with JSON data
-            indicating the health of each dependency service.
-        HttpResponse: 503 if the badges service is unavailable, with JSON data
-            indicating the health of each dependency service
-    Example:
-        >>> response = requests.get('/health')
-        >>> response.status_code
-        200
-        >>> response.content
-        '{"overall_status": "OK", "detailed_status": {"database_status": "OK"}}'
+        dict: the overall status and the status of each dependency service.
     """
     overall_status = database_status = UNAVAILABLE
 
@@ -47,7 +36,7 @@ def health(req):
 
     overall_status = OK if (database_status == OK) else UNAVAILABLE
 
-    data = {
+    return {
         'overall_status': overall_status,
         'detailed_status': {
             'database_status': database_status
@@ -55,7 +44,28 @@ def health(req):
         }
     }
 
-    if overall_status == OK:
+
+def health(req):
+    """
+    Allows a load balancer to verify that the badges service is up and OK.
+
+    Integrate checks on the database and any other service that this application depends on.
+
+    Returns:
+        HttpResponse: 200 if the badges service is available, with JSON data
+            indicating the health of each dependency service.
+        HttpResponse: 503 if the badges service is unavailable, with JSON data
+            indicating the health of each dependency service
+    Example:
+        >>> response = requests.get('/health')
+        >>> response.status_code
+        200
+        >>> response.content
+        '{"overall_status": "OK", "detailed_status": {"database_status": "OK"}}'
+    """
+    data = get_health_status()
+
+    if data['overall_status'] == OK:
         return JsonResponse(data)
     else:
         return JsonResponse(data, status=status.HTTP_503_SERVICE_UNAVAILABLE)
@@ -403,7 +403,7 @@ class BadgeInstanceList(UncachedPaginatedViewMixin, VersionedObjectMixin, BaseEn
 
     def get_queryset(self, request=None, **kwargs):
         badgeclass = self.get_object(request, **kwargs)
-        queryset = BadgeInstance.objects.filter(badgeclass=badgeclass)
+        queryset = BadgeInstance.objects.with_json_prefetch().filter(badgeclass=badgeclass)
         recipients = request.query_params.getlist('recipient', None)
         if recipients:
             queryset = queryset.filter(recipient_identifier__in=recipients)
@@ -482,7 +482,7 @@ class IssuerBadgeInstanceList(UncachedPaginatedViewMixin, VersionedObjectMixin,
 
     def get_queryset(self, request=None, **kwargs):
         issuer = self.get_object(request, **kwargs)
-        queryset = BadgeInstance.objects.filter(issuer=issuer)
+        queryset = BadgeInstance.objects.with_json_prefetch().filter(issuer=issuer)
         recipients = request.query_params.getlist('recipient', None)
         if recipients:
             queryset = queryset.filter(recipient_identifier__in=recipients)
@@ -702,7 +702,7 @@ class AssertionsChangedSince(BaseEntityView):
         if since is not None:
             expr &= Q(updated_at__gt=since)
 
-        qs = BadgeInstance.objects.filter(expr).distinct()
+        qs = BadgeInstance.objects.with_json_prefetch().filter(expr).distinct()
         return qs
 
     def get(self, request, **kwargs):
@@ -806,7 +806,7 @@ class IssuersChangedSince(BaseEntityView):
         if since is not None:
             expr &= Q(updated_at__gt=since)
 
-        qs = Issuer.objects.filter(expr).distinct()
+        qs = Issuer.objects.with_json_prefetch().filter(expr).distinct()
         return qs
 
     def get(self, request, **kwargs):
@@ -43,6 +43,13 @@ class IssuerManager(BaseOpenBadgeObjectManager):
         'image/svg+xml',
     ]
 
+    def with_json_prefetch(self):
+        """
+        Issuers with the relations rendered by the issuer serializers already loaded, for uncached list queries.
+        The legacy old_json blob is never rendered and is left unloaded.
+        """
+        return self.get_queryset().defer('old_json').prefetch_related('issuerextension_set', 'issuerstaff_set__user')
+
     def update_from_ob2(self, issuer_obo, original_json=None):
         image = self.image_from_ob2(issuer_obo)
         return self.update_or_create(
@@ -197,6 +204,13 @@ class BadgeInstanceManager(BaseOpenBadgeObjectManager):
         'image/svg+xml',
     ]
 
+    def with_json_prefetch(self):
+        """
+        Assertions with the relations rendered by the assertion serializers already loaded, for uncached list queries.
+        The legacy old_json blob is never rendered and is left unloaded.
+        """
+        return self.get_queryset().defer('old_json').prefetch_related('badgeinstanceevidence_set', 'badgeinstanceextension_set')
+
     def update_from_ob2(self, badgeclass, assertion_obo, recipient_identifier, recipient_type='email', original_json=None):
         image = None
         image_url = assertion_obo.get('image', None)
@@ -0,0 +1,17 @@
+# Generated by Django 2.2.24 on 2026-10-15 12:00
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('issuer', '0064_auto_20211122_0929'),
+    ]
+
+    operations = [
+        migrations.AlterIndexTogether(
+            name='badgeinstance',
+            index_together={('recipient_identifier', 'badgeclass', 'revoked'), ('badgeclass', 'revoked', 'expires_at')},
+        ),
+    ]
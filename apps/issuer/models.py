@@ -1,11 +1,11 @@
+import copy
 import io
-import datetime
 import urllib.request, urllib.parse, urllib.error
 
 import dateutil
 import re
 import uuid
-from collections import OrderedDict
+from functools import wraps
 from itertools import chain
 
 import cachemodel
@@ -18,14 +18,12 @@ from django.contrib.auth import get_user_model
 from django.core.exceptions import ValidationError
 from django.core.files.base import ContentFile
 from django.core.files.storage import default_storage
-from django.urls import reverse
+from django.core.mail import get_connection
+from django.urls import get_script_prefix
 from django.db import models, transaction
 from django.db.models import ProtectedError
-from json import loads as json_loads
-from json import dumps as json_dumps
 
 from jsonfield import JSONField
-from openbadges_bakery import bake
 from django.utils import timezone
 from django.core.cache import cache
 
@@ -37,12 +35,12 @@ from mainsite.mixins import HashUploadedImage, ResizeUploadedImage, ScrubUploade
 from mainsite.models import BadgrApp, EmailBlacklist
 from mainsite import blacklist
 from mainsite.utils import OriginSetting, generate_entity_uri
+from mainsite.json_compat import loads as json_loads, dumps as json_dumps
+from mainsite.urlutils import cached_reverse
 
 from .utils import (add_obi_version_ifneeded, CURRENT_OBI_VERSION, generate_rebaked_filename,
                     generate_sha256_hashstring, get_obi_context, parse_original_datetime, UNVERSIONED_BAKED_VERSION)
 
-from geopy.geocoders import Nominatim
-
 AUTH_USER_MODEL = getattr(settings, 'AUTH_USER_MODEL', 'auth.User')
 
 RECIPIENT_TYPE_EMAIL = 'email'
@@ -50,8 +48,32 @@ RECIPIENT_TYPE_ID = 'openBadgeId'
 RECIPIENT_TYPE_TELEPHONE = 'telephone'
 RECIPIENT_TYPE_URL = 'url'
 
+_NAME_SCRUB_RE = re.compile(r'[^\w\s]+', re.I)
+
+# public json routes from issuer/public_api_urls.py, formatted directly since they are built for every serialized
+# object. PublicUrlTemplateTests keeps them in sync with reverse().
+PUBLIC_ISSUER_PATH = 'public/issuers/{}'
+PUBLIC_BADGECLASS_PATH = 'public/badges/{}'
+PUBLIC_ASSERTION_PATH = 'public/assertions/{}'
+
+# never equal to a real attribute value, see BaseOpenBadgeObjectModel.__eq__
+_UNUSABLE_DEFAULT = object()
+
 logger = badgrlog.BadgrLogger()
 
+_badgeuser_models = {}
+
+
+def _badgeuser_model(model_name):
+    """
+    Resolve a badgeuser model once per process; badgeuser.models imports this module so it can't be imported at the top.
+    """
+    try:
+        return _badgeuser_models[model_name]
+    except KeyError:
+        model = _badgeuser_models[model_name] = apps.get_model('badgeuser', model_name)
+        return model
+
 
 class BaseAuditedModel(cachemodel.CacheModel):
     created_at = models.DateTimeField(auto_now_add=True, db_index=True)
@@ -87,12 +109,63 @@ class BaseAuditedModelDeletedWithUser(cachemodel.CacheModel):
         return BadgeUser.cached.get(id=self.created_by_id)
 
 
+# per-instance memos, left out when an instance is pickled into the cache
+_MEMO_ATTRIBUTES = ('_original_json_cache', '_recipient_identity_hash_cache')
+
+
+def _state_without_memos(state):
+    for attr in _MEMO_ATTRIBUTES:
+        state.pop(attr, None)
+    return state
+
+
+def _parse_original_json(obj):
+    """
+    Parse obj.original_json, memoized on the instance for as long as original_json is the same string object.
+    Reassigning original_json invalidates the cached value. The result is shared, use it only for read-only lookups;
+    get_original_json() returns a fresh parse that callers are free to modify.
+    """
+    cached = obj.__dict__.get('_original_json_cache')
+    if cached is not None and cached[0] is obj.original_json:
+        return cached[1]
+
+    parsed = None
+    if obj.original_json:
+        try:
+            parsed = json_loads(obj.original_json)
+        except (TypeError, ValueError) as e:
+            pass
+    obj._original_json_cache = (obj.original_json, parsed)
+    return parsed
+
+
+def prefer_prefetched(get_related_manager):
+    """
+    Wrap a @cachemodel.cached_method that returns a reverse relation, so that rows already loaded by
+    prefetch_related() are returned instead of doing a cache lookup. The prefetched rows are dropped by
+    BaseOpenBadgeObjectModel.discard_prefetched() as soon as the object or its relations are written.
+    """
+    def decorator(method):
+        @wraps(method)
+        def wrapper(self, *args, **kwargs):
+            cache_name = get_related_manager(self).field.remote_field.get_cache_name()
+            prefetched = getattr(self, '_prefetched_objects_cache', {})
+            if cache_name in prefetched:
+                return prefetched[cache_name]
+            return method(self, *args, **kwargs)
+        return wrapper
+    return decorator
+
+
 class OriginalJsonMixin(models.Model):
     original_json = models.TextField(blank=True, null=True, default=None)
 
     class Meta:
         abstract = True
 
+    def __getstate__(self):
+        return _state_without_memos(super(OriginalJsonMixin, self).__getstate__())
+
     def get_original_json(self):
         if self.original_json:
             try:
@@ -103,7 +176,7 @@ class OriginalJsonMixin(models.Model):
     def get_filtered_json(self, excluded_fields=()):
         original = self.get_original_json()
         if original is not None:
-            return {key: original[key] for key in [k for k in list(original.keys()) if k not in excluded_fields]}
+            return {key: value for key, value in original.items() if key not in excluded_fields}
 
 
 class BaseOpenBadgeObjectModel(OriginalJsonMixin, cachemodel.CacheModel):
@@ -116,49 +189,64 @@ class BaseOpenBadgeObjectModel(OriginalJsonMixin, cachemodel.CacheModel):
     def get_extensions_manager(self):
         raise NotImplementedError()
 
+    def discard_prefetched(self):
+        """
+        Forget related rows loaded by prefetch_related(), they are out of date once this object or its relations are
+        written and must not be served by the @prefer_prefetched methods or pickled into the cache.
+        """
+        self.__dict__.pop('_prefetched_objects_cache', None)
+
+    def publish(self, *args, **kwargs):
+        self.discard_prefetched()
+        super(BaseOpenBadgeObjectModel, self).publish(*args, **kwargs)
+
     def __hash__(self):
         return hash((self.source, self.source_url))
 
     def __eq__(self, other):
-        UNUSABLE_DEFAULT = uuid.uuid4()
+        if self is other:
+            return True
 
         comparable_properties = getattr(self, 'COMPARABLE_PROPERTIES', None)
         if comparable_properties is None:
             return super(BaseOpenBadgeObjectModel, self).__eq__(other)
 
-        for prop in self.COMPARABLE_PROPERTIES:
-            if getattr(self, prop) != getattr(other, prop, UNUSABLE_DEFAULT):
+        for prop in comparable_properties:
+            if getattr(self, prop) != getattr(other, prop, _UNUSABLE_DEFAULT):
                 return False
         return True
 
+    @prefer_prefetched(lambda obj: obj.get_extensions_manager())
     @cachemodel.cached_method(auto_publish=True)
     def cached_extensions(self):
         return self.get_extensions_manager().all()
 
     @property
     def extension_items(self):
-        return {e.name: json_loads(e.original_json) for e in self.cached_extensions()}
+        return {e.name: e.get_original_json() for e in self.cached_extensions()}
 
     @extension_items.setter
     def extension_items(self, value):
         if value is None:
             value = {}
-        touched_idx = []
+        touched_idx = set()
+        self.discard_prefetched()
 
         with transaction.atomic():
             if not self.pk and value:
                 self.save()
 
             # add new
-            for ext_name, ext in list(value.items()):
-                ext_json = json_dumps(ext)
+            for ext_name, ext_value in value.items():
+                ext_json = json_dumps(ext_value)
                 ext, ext_created = self.get_extensions_manager().get_or_create(name=ext_name, defaults=dict(
                     original_json=ext_json
                 ))
-                if not ext_created:
+                # compare parsed values so a change in serializer formatting alone doesn't force a write
+                if not ext_created and _parse_original_json(ext) != ext_value:
                     ext.original_json = ext_json
                     ext.save()
-                touched_idx.append(ext.pk)
+                touched_idx.add(ext.pk)
 
             # remove old
             for extension in self.cached_extensions():
@@ -176,6 +264,16 @@ class BaseOpenBadgeExtension(cachemodel.CacheModel):
     class Meta:
         abstract = True
 
+    def __getstate__(self):
+        return _state_without_memos(super(BaseOpenBadgeExtension, self).__getstate__())
+
+    def get_original_json(self):
+        if self.original_json:
+            try:
+                return json_loads(self.original_json)
+            except (TypeError, ValueError) as e:
+                pass
+
 
 class Issuer(ResizeUploadedImage,
              ScrubUploadedSvgImage,
@@ -220,13 +318,10 @@ class Issuer(ResizeUploadedImage,
     lat = models.FloatField(null=True, blank=True)
     lon = models.FloatField(null=True, blank=True)
 
-    __original_address = {
-        'street': None,
-        'streetnumber': None,
-        'zip': None,
-        'city': None,
-        'country': None
-    }
+    ADDRESS_FIELDS = ('street', 'streetnumber', 'city', 'zip', 'country')
+
+    # address as last loaded from or saved to the database, None if it wasn't loaded
+    _original_address = (None, None, None, None, None)
 
     def publish(self, publish_staff=True, *args, **kwargs):
         fields_cache = self._state.fields_cache  # stash the fields cache to avoid publishing related objects here
@@ -246,16 +341,19 @@ class Issuer(ResizeUploadedImage,
         if self.has_nonrevoked_assertions():
             raise ProtectedError("Issuer can not be deleted because it has previously issued badges.", self)
 
-        # remove any unused badgeclasses owned by issuer
-        for bc in self.cached_badgeclasses():
-            bc.delete()
+        with transaction.atomic():
+            # remove any unused badgeclasses owned by issuer, no need to republish an issuer that is going away
+            for bc in self.cached_badgeclasses():
+                bc.delete(publish_issuer=False)
 
-        staff = self.cached_issuerstaff()
-        ret = super(Issuer, self).delete(*args, **kwargs)
+            staff = list(self.cached_issuerstaff())
+            ret = super(Issuer, self).delete(*args, **kwargs)
 
-        # remove membership records
+        # membership records were removed by the cascade, only their caches need to be cleared
         for membership in staff:
-            membership.delete(publish_issuer=False)
+            membership.publish_delete('pk')
+        for user in get_user_model().objects.filter(pk__in={m.user_id for m in staff}):
+            user.publish()
 
         if apps.is_installed('badgebook'):
             # badgebook shim
@@ -270,35 +368,47 @@ class Issuer(ResizeUploadedImage,
 
         return ret
 
-    # override init method to save original address
-    def __init__(self, *args, **kwargs):
-            super().__init__(*args, **kwargs)
-            self.__original_address = { 'street': self.street, 'streetnumber': self.streetnumber, 'city': self.city, 'zip': self.zip, 'country': self.country }
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super(Issuer, cls).from_db(db, field_names, values)
+        loaded = instance.__dict__
+        if all(f in loaded for f in cls.ADDRESS_FIELDS):
+            instance._original_address = tuple(loaded[f] for f in cls.ADDRESS_FIELDS)
+        else:
+            instance._original_address = None
+        return instance
 
     def save(self, *args, **kwargs):
-        if not self.pk:
-            self.notify_admins(self)
-       
+        is_new = not self.pk
+
         #geocoding if address in model changed
-        if self.__original_address:
-            if (self.street != self.__original_address['street'] or self.streetnumber != self.__original_address['streetnumber'] or self.city != self.__original_address['city'] or self.zip != self.__original_address['zip'] or self.country != self.__original_address['country']):
-                addr_string = (self.street if self.street != None else '') +" "+ (str(self.streetnumber) if self.streetnumber != None else '') +" "+ (str(self.zip) if self.zip != None else '')+" "+ (str(self.city) if self.city != None else '') + " Deutschland"
-                nom = Nominatim(user_agent="myBadges")
-                geoloc = nom.geocode(addr_string)
-                if geoloc:
-                    self.lon = geoloc.longitude
-                    self.lat = geoloc.latitude
-        
+        addr_string = None
+        address = (self.street, self.streetnumber, self.city, self.zip, self.country)
+        if self._original_address is not None and address != self._original_address:
+            addr_string = " ".join(part or '' for part in (self.street, self.streetnumber, self.zip, self.city)) + " Deutschland"
+
         ret = super(Issuer, self).save(*args, **kwargs)
+        self._original_address = address
+
+        if addr_string is not None:
+            # geocode out of band, nominatim is a rate-limited third party service
+            from issuer.tasks import geocode_issuer_address
+            issuer_pk = self.pk
+            transaction.on_commit(lambda: geocode_issuer_address.delay(issuer_pk, addr_string))
+
+        if is_new:
+            from issuer.tasks import notify_admins_of_new_issuer
+            issuer_pk = self.pk
+            transaction.on_commit(lambda: notify_admins_of_new_issuer.delay(issuer_pk))
 
         # if no owner staff records exist, create one for created_by
-        if len(self.owners) < 1 and self.created_by_id:
+        if self.created_by_id and not any(s.role == IssuerStaff.ROLE_OWNER for s in self.cached_issuerstaff()):
             IssuerStaff.objects.create(issuer=self, user=self.created_by, role=IssuerStaff.ROLE_OWNER)
 
         return ret
 
     def get_absolute_url(self):
-        return reverse('issuer_json', kwargs={'entity_id': self.entity_id})
+        return get_script_prefix() + PUBLIC_ISSUER_PATH.format(self.entity_id)
 
     @property
     def public_url(self):
@@ -307,7 +417,7 @@ class Issuer(ResizeUploadedImage,
     def image_url(self, public=False):
         if bool(self.image):
             if public:
-                return OriginSetting.HTTP + reverse('issuer_image', kwargs={'entity_id': self.entity_id})
+                return OriginSetting.HTTP + cached_reverse('issuer_image', self.entity_id)
             if getattr(settings, 'MEDIA_URL').startswith('http'):
                 return default_storage.url(self.image.name)
             else:
@@ -329,6 +439,7 @@ class Issuer(ResizeUploadedImage,
     def owners(self):
         return self.staff.filter(issuerstaff__role=IssuerStaff.ROLE_OWNER)
 
+    @prefer_prefetched(lambda obj: obj.issuerstaff_set)
     @cachemodel.cached_method(auto_publish=True)
     def cached_issuerstaff(self):
         return IssuerStaff.objects.filter(issuer=self)
@@ -342,28 +453,50 @@ class Issuer(ResizeUploadedImage,
         """
         Update this issuers IssuerStaff from a list of IssuerStaffSerializerV2 data
         """
-        existing_staff_idx = {s.cached_user: s for s in self.staff_items}
-        new_staff_idx = {s['cached_user']: s for s in value}
+        self.discard_prefetched()
+        existing_staff_idx = {s.user_id: s for s in self.staff_items}
+        new_staff_idx = {s['cached_user'].pk: s for s in value}
 
         with transaction.atomic():
             # add missing staff records
-            for staff_data in value:
-                if staff_data['cached_user'] not in existing_staff_idx:
-                    staff_record, created = IssuerStaff.cached.get_or_create(
-                        issuer=self,
-                        user=staff_data['cached_user'],
-                        defaults={
-                            'role': staff_data['role']
-                        })
-                    if not created:
-                        staff_record.role = staff_data['role']
-                        staff_record.save()
-
-            # remove old staff records -- but never remove the only OWNER role
-            for staff_record in self.staff_items:
-                if staff_record.cached_user not in new_staff_idx:
-                    if staff_record.role != IssuerStaff.ROLE_OWNER or len(self.owners) > 1:
-                        staff_record.delete()
+            added = [IssuerStaff(issuer=self, user=staff_data['cached_user'], role=staff_data['role'])
+                     for user_id, staff_data in new_staff_idx.items() if user_id not in existing_staff_idx]
+            IssuerStaff.objects.bulk_create(added, ignore_conflicts=True)
+
+            # update the role of the staff records that are kept
+            changed = [s for user_id, s in existing_staff_idx.items()
+                       if user_id in new_staff_idx and s.role != new_staff_idx[user_id]['role']]
+            demoted = [s for s in changed if s.role == IssuerStaff.ROLE_OWNER]
+            for staff_record in changed:
+                staff_record.role = new_staff_idx[staff_record.user_id]['role']
+
+            # remove old staff records
+            removed = [s for user_id, s in existing_staff_idx.items() if user_id not in new_staff_idx]
+
+            # but never leave the issuer without an OWNER, keep an owner being removed or undo a demotion instead
+            kept = [s for s in chain(existing_staff_idx.values(), added) if s.user_id in new_staff_idx]
+            if not any(s.role == IssuerStaff.ROLE_OWNER for s in kept):
+                removed_owners = [s for s in removed if s.role == IssuerStaff.ROLE_OWNER]
+                if removed_owners:
+                    removed.remove(removed_owners[-1])
+                elif demoted:
+                    demoted[0].role = IssuerStaff.ROLE_OWNER
+                    changed.remove(demoted[0])
+
+            if changed:
+                IssuerStaff.objects.bulk_update(changed, ['role'])
+            if removed:
+                IssuerStaff.objects.filter(pk__in=[s.pk for s in removed]).delete()
+
+        # bulk operations skip IssuerStaff.publish/delete, update the caches once here instead
+        if added or changed or removed:
+            for staff_record in changed:
+                super(IssuerStaff, staff_record).publish()
+            for staff_record in removed:
+                staff_record.publish_delete('pk')
+            self.publish(publish_staff=False)
+            for staff_record in chain(added, changed, removed):
+                staff_record.cached_user.publish()
 
     def get_extensions_manager(self):
         return self.issuerextension_set
@@ -384,24 +517,24 @@ class Issuer(ResizeUploadedImage,
     def get_json(self, obi_version=CURRENT_OBI_VERSION, include_extra=True, use_canonical_id=False):
         obi_version, context_iri = get_obi_context(obi_version)
 
-        json = OrderedDict({'@context': context_iri})
-        json.update(OrderedDict(
-            type='Issuer',
-            id=self.jsonld_id if use_canonical_id else add_obi_version_ifneeded(self.jsonld_id, obi_version),
-            name=self.name,
-            url=self.url,
-            email=self.email,
-            description=self.description,
-            category=self.category,
-            slug=self.entity_id))
+        json = {
+            '@context': context_iri,
+            'type': 'Issuer',
+            'id': self.jsonld_id if use_canonical_id else add_obi_version_ifneeded(self.jsonld_id, obi_version),
+            'name': self.name,
+            'url': self.url,
+            'email': self.email,
+            'description': self.description,
+            'category': self.category,
+            'slug': self.entity_id,
+        }
 
         image_url = self.image_url(public=True)
         json['image'] = image_url
         if self.original_json:
-            image_info = self.get_original_json().get('image', None)
+            image_info = _parse_original_json(self).get('image', None)
             if isinstance(image_info, dict):
-                json['image'] = image_info
-                json['image']['id'] = image_url
+                json['image'] = dict(copy.deepcopy(image_info), id=image_url)
 
         # source url
         if self.source_url:
@@ -413,15 +546,14 @@ class Issuer(ResizeUploadedImage,
                 json["hostedUrl"] = OriginSetting.HTTP + self.get_absolute_url()
 
         # extensions
-        if len(self.cached_extensions()) > 0:
-            for extension in self.cached_extensions():
-                json[extension.name] = json_loads(extension.original_json)
+        for extension in self.cached_extensions():
+            json[extension.name] = extension.get_original_json()
 
         # pass through imported json
         if include_extra:
             extra = self.get_filtered_json()
             if extra is not None:
-                for k,v in list(extra.items()):
+                for k, v in extra.items():
                     if k not in json:
                         json[k] = v
 
@@ -431,7 +563,7 @@ class Issuer(ResizeUploadedImage,
     def json(self):
         return self.get_json()
 
-    def get_filtered_json(self, excluded_fields=('@context', 'id', 'type', 'name', 'url', 'description', 'image', 'email')):
+    def get_filtered_json(self, excluded_fields=frozenset(('@context', 'id', 'type', 'name', 'url', 'description', 'image', 'email'))):
         return super(Issuer, self).get_filtered_json(excluded_fields=excluded_fields)
 
     @property
@@ -439,20 +571,16 @@ class Issuer(ResizeUploadedImage,
         id = self.badgrapp_id if self.badgrapp_id else None
         return BadgrApp.objects.get_by_id_or_default(badgrapp_id=id)
 
-    def has_nonrevoked_assertions(self):
-        return self.badgeinstance_set.filter(revoked=False).exists()
-
     def notify_admins(self, badgr_app=None, renotify=False):
         """
-        Sends an email notification to the badge recipient.
+        Sends an email notification about this issuer to all staff users.
         """
 
         if badgr_app is None:
-            badgr_app = self.cached_issuer.cached_badgrapp
+            badgr_app = self.cached_badgrapp
         if badgr_app is None:
             badgr_app = BadgrApp.objects.get_current(None)
 
-        print(badgr_app)
         UserModel = get_user_model()
         users = UserModel.objects.filter(is_staff=True)
 
@@ -461,7 +589,7 @@ class Issuer(ResizeUploadedImage,
             # 'badge_id': self.entity_id,
             # 'badge_description': self.badgeclass.description,
             # 'help_email': getattr(settings, 'HELP_EMAIL', 'help@badgr.io'),
-            'issuer_name': re.sub(r'[^\w\s]+', '', self.name, 0, re.I),
+            'issuer_name': _NAME_SCRUB_RE.sub('', self.name),
             'users': users,
             # 'issuer_email': self.issuer.email,
             # 'issuer_detail': self.issuer.public_url,
@@ -477,9 +605,10 @@ class Issuer(ResizeUploadedImage,
         template_name = 'issuer/email/notify_admins'
 
         adapter = get_adapter()
-        for user in users:
-            adapter.send_mail(template_name, user.email, context=email_context)
-            
+        with get_connection() as connection:
+            for user in users:
+                # send_mail fills in per-recipient values like unsubscribe_url, so each message gets its own context
+                adapter.send_mail(template_name, user.email, context=dict(email_context), connection=connection)
 
 
 class IssuerStaff(cachemodel.CacheModel):
@@ -514,6 +643,8 @@ class IssuerStaff(cachemodel.CacheModel):
 
     @property
     def cached_user(self):
+        if IssuerStaff.user.is_cached(self):
+            return self.user
         from badgeuser.models import BadgeUser
         return BadgeUser.cached.get(pk=self.user_id)
 
@@ -597,13 +728,14 @@ class BadgeClass(ResizeUploadedImage,
 
     def delete(self, *args, **kwargs):
         # if there are some assertions that have not expired
-        if self.badgeinstances.filter(revoked=False).filter(
-                models.Q(expires_at__isnull=True) | models.Q(expires_at__gt=timezone.now())).exists():
+        if self.badgeinstances.filter(revoked=False).exclude(expires_at__lte=timezone.now()).exists():
             raise ProtectedError("BadgeClass may only be deleted if all BadgeInstances have been revoked.", self)
 
+        publish_issuer = kwargs.pop('publish_issuer', True)
         issuer = self.issuer
         super(BadgeClass, self).delete(*args, **kwargs)
-        issuer.publish(publish_staff=False)
+        if publish_issuer:
+            issuer.publish(publish_staff=False)
 
     def schedule_image_update_task(self):
         from issuer.tasks import rebake_all_assertions_for_badge_class
@@ -611,7 +743,7 @@ class BadgeClass(ResizeUploadedImage,
         rebake_all_assertions_for_badge_class.delay(self.pk, limit=batch_size, replay=True)
 
     def get_absolute_url(self):
-        return reverse('badgeclass_json', kwargs={'entity_id': self.entity_id})
+        return get_script_prefix() + PUBLIC_BADGECLASS_PATH.format(self.entity_id)
 
 
     @property
@@ -631,7 +763,7 @@ class BadgeClass(ResizeUploadedImage,
     def get_criteria_url(self):
         if self.criteria_url:
             return self.criteria_url
-        return OriginSetting.HTTP+reverse('badgeclass_criteria', kwargs={'entity_id': self.entity_id})
+        return OriginSetting.HTTP+cached_reverse('badgeclass_criteria', self.entity_id)
 
     @property
     def description_nonnull(self):
@@ -690,14 +822,20 @@ class BadgeClass(ResizeUploadedImage,
                 self.save()
 
             # add missing records
-            for align in value:
-                if _identity(align) not in existing_idx:
-                    alignment = self.badgeclassalignment_set.create(**align)
+            added = [BadgeClassAlignment(badgeclass=self, **align)
+                     for identity, align in new_idx.items() if identity not in existing_idx]
+            BadgeClassAlignment.objects.bulk_create(added)
 
             # remove old records
-            for alignment in self.alignment_items:
-                if _obj_identity(alignment) not in new_idx:
-                    alignment.delete()
+            removed = [alignment for identity, alignment in existing_idx.items() if identity not in new_idx]
+            if removed:
+                BadgeClassAlignment.objects.filter(pk__in=[a.pk for a in removed]).delete()
+
+        # bulk operations skip BadgeClassAlignment.publish/delete, republish once here instead
+        if added or removed:
+            for alignment in removed:
+                alignment.publish_delete('pk')
+            self.publish()
 
     @cachemodel.cached_method(auto_publish=True)
     def cached_tags(self):
@@ -711,22 +849,27 @@ class BadgeClass(ResizeUploadedImage,
     def tag_items(self, value):
         if value is None:
             value = []
-        existing_idx = [t.name for t in self.tag_items]
-        new_idx = value
+        existing_idx = {t.name: t for t in self.tag_items}
+        new_idx = set(value)
 
         with transaction.atomic():
             if not self.pk:
                 self.save()
 
             # add missing
-            for t in value:
-                if t not in existing_idx:
-                    tag = self.badgeclasstag_set.create(name=t)
+            added = [BadgeClassTag(badgeclass=self, name=t) for t in dict.fromkeys(value) if t not in existing_idx]
+            BadgeClassTag.objects.bulk_create(added)
 
             # remove old
-            for tag in self.tag_items:
-                if tag.name not in new_idx:
-                    tag.delete()
+            removed = [tag for name, tag in existing_idx.items() if name not in new_idx]
+            if removed:
+                BadgeClassTag.objects.filter(pk__in=[t.pk for t in removed]).delete()
+
+        # bulk operations skip BadgeClassTag.publish/delete, republish once here instead
+        if added or removed:
+            for tag in removed:
+                tag.publish_delete('pk')
+            self.publish()
 
     def get_extensions_manager(self):
         return self.badgeclassextension_set
@@ -743,7 +886,7 @@ class BadgeClass(ResizeUploadedImage,
 
     def image_url(self, public=False):
         if public:
-            return OriginSetting.HTTP + reverse('badgeclass_image', kwargs={'entity_id': self.entity_id})
+            return OriginSetting.HTTP + cached_reverse('badgeclass_image', self.entity_id)
 
         if getattr(settings, 'MEDIA_URL').startswith('http'):
             return default_storage.url(self.image.name)
@@ -754,26 +897,25 @@ class BadgeClass(ResizeUploadedImage,
 
     def get_json(self, obi_version=CURRENT_OBI_VERSION, include_extra=True, use_canonical_id=False):
         obi_version, context_iri = get_obi_context(obi_version)
-        json = OrderedDict({'@context': context_iri})
-        json.update(OrderedDict(
-            type='BadgeClass',
-            id=self.jsonld_id if use_canonical_id else add_obi_version_ifneeded(self.jsonld_id, obi_version),
-            name=self.name,
-            description=self.description_nonnull,
-            issuer=self.cached_issuer.jsonld_id if use_canonical_id else add_obi_version_ifneeded(self.cached_issuer.jsonld_id, obi_version),
-        ))
+        json = {
+            '@context': context_iri,
+            'type': 'BadgeClass',
+            'id': self.jsonld_id if use_canonical_id else add_obi_version_ifneeded(self.jsonld_id, obi_version),
+            'name': self.name,
+            'description': self.description_nonnull,
+            'issuer': self.cached_issuer.jsonld_id if use_canonical_id else add_obi_version_ifneeded(self.cached_issuer.jsonld_id, obi_version),
+        }
 
         # image
         if self.image:
             image_url = self.image_url(public=True)
             json['image'] = image_url
             if self.original_json:
-                original_json = self.get_original_json()
+                original_json = _parse_original_json(self)
                 if original_json is not None:
                     image_info = original_json.get('image', None)
                     if isinstance(image_info, dict):
-                        json['image'] = image_info
-                        json['image']['id'] = image_url
+                        json['image'] = dict(copy.deepcopy(image_info), id=image_url)
 
         # criteria
         if obi_version == '1_1':
@@ -796,19 +938,18 @@ class BadgeClass(ResizeUploadedImage,
 
         # alignment / tags
         if obi_version == '2_0':
-            json['alignment'] = [ a.get_json(obi_version=obi_version) for a in self.cached_alignments() ]
-            json['tags'] = list(t.name for t in self.cached_tags())
+            json['alignment'] = [a.get_json(obi_version=obi_version) for a in self.cached_alignments()]
+            json['tags'] = [t.name for t in self.cached_tags()]
 
         # extensions
-        if len(self.cached_extensions()) > 0:
-            for extension in self.cached_extensions():
-                json[extension.name] = json_loads(extension.original_json)
+        for extension in self.cached_extensions():
+            json[extension.name] = extension.get_original_json()
 
         # pass through imported json
         if include_extra:
             extra = self.get_filtered_json()
             if extra is not None:
-                for k,v in list(extra.items()):
+                for k, v in extra.items():
                     if k not in json:
                         json[k] = v
 
@@ -818,7 +959,7 @@ class BadgeClass(ResizeUploadedImage,
     def json(self):
         return self.get_json()
 
-    def get_filtered_json(self, excluded_fields=('@context', 'id', 'type', 'name', 'description', 'image', 'criteria', 'issuer')):
+    def get_filtered_json(self, excluded_fields=frozenset(('@context', 'id', 'type', 'name', 'description', 'image', 'criteria', 'issuer'))):
         return super(BadgeClass, self).get_filtered_json(excluded_fields=excluded_fields)
 
     @property
@@ -894,6 +1035,7 @@ class BadgeInstance(BaseAuditedModel,
     class Meta:
         index_together = (
                 ('recipient_identifier', 'badgeclass', 'revoked'),
+                ('badgeclass', 'revoked', 'expires_at'),
         )
 
     @property
@@ -906,7 +1048,7 @@ class BadgeInstance(BaseAuditedModel,
 
     def image_url(self, public=False):
         if public:
-            return OriginSetting.HTTP + reverse('badgeinstance_image', kwargs={'entity_id': self.entity_id})
+            return OriginSetting.HTTP + cached_reverse('badgeinstance_image', self.entity_id)
         if getattr(settings, 'MEDIA_URL').startswith('http'):
             return default_storage.url(self.image.name)
         else:
@@ -932,7 +1074,7 @@ class BadgeInstance(BaseAuditedModel,
         return BadgeClass.cached.get(pk=self.badgeclass_id)
 
     def get_absolute_url(self):
-        return reverse('badgeinstance_json', kwargs={'entity_id': self.entity_id})
+        return get_script_prefix() + PUBLIC_ASSERTION_PATH.format(self.entity_id)
 
     @property
     def jsonld_id(self):
@@ -963,7 +1105,11 @@ class BadgeInstance(BaseAuditedModel,
             does not exist or is unverified the BadgeInstance is
             considered "pending"
         """
-        from badgeuser.models import CachedEmailAddress, UserRecipientIdentifier
+        if not self.source_url:
+            return False
+
+        CachedEmailAddress = _badgeuser_model('CachedEmailAddress')
+        UserRecipientIdentifier = _badgeuser_model('UserRecipientIdentifier')
         try:
             if self.recipient_type == RECIPIENT_TYPE_EMAIL:
                 existing_identifier = CachedEmailAddress.cached.get(email=self.recipient_identifier)
@@ -972,9 +1118,6 @@ class BadgeInstance(BaseAuditedModel,
         except (UserRecipientIdentifier.DoesNotExist, CachedEmailAddress.DoesNotExist,):
             return False
 
-        if not self.source_url:
-            return False
-
         return not existing_identifier.verified
 
     def save(self, *args, **kwargs):
@@ -985,24 +1128,25 @@ class BadgeInstance(BaseAuditedModel,
                 raise ValidationError("You may not award this badge to this recipient.")
 
             self.salt = uuid.uuid4().hex
-            self.created_at = datetime.datetime.now()
+            self.created_at = timezone.now()
 
             # do this now instead of in AbstractVersionedEntity.save() so we can use it for image name
             if self.entity_id is None:
                 self.entity_id = generate_entity_uri()
 
             if not self.image:
+                from openbadges_bakery import bake
                 badgeclass_name, ext = os.path.splitext(self.badgeclass.image.file.name)
                 new_image = io.BytesIO()
                 bake(image_file=self.cached_badgeclass.image.file,
                      assertion_json_string=json_dumps(self.get_json(obi_version=UNVERSIONED_BAKED_VERSION), indent=2),
                      output_file=new_image)
                 self.image.save(name='assertion-{id}{ext}'.format(id=self.entity_id, ext=ext),
-                                content=ContentFile(new_image.read()),
+                                content=ContentFile(new_image.getvalue()),
                                 save=False)
 
+            CachedEmailAddress = _badgeuser_model('CachedEmailAddress')
             try:
-                from badgeuser.models import CachedEmailAddress
                 existing_email = CachedEmailAddress.cached.get(email=self.recipient_identifier)
                 if self.recipient_identifier != existing_email.email and \
                         self.recipient_identifier not in [e.email for e in existing_email.cached_variants()]:
@@ -1016,6 +1160,7 @@ class BadgeInstance(BaseAuditedModel,
         super(BadgeInstance, self).save(*args, **kwargs)
 
     def rebake(self, obi_version=CURRENT_OBI_VERSION, save=True):
+        from openbadges_bakery import bake
         new_image = io.BytesIO()
         bake(
             image_file=self.cached_badgeclass.image.file,
@@ -1024,7 +1169,7 @@ class BadgeInstance(BaseAuditedModel,
         )
 
         new_filename = generate_rebaked_filename(self.image.name, self.cached_badgeclass.image.name)
-        new_name = default_storage.save(new_filename, ContentFile(new_image.read()))
+        new_name = default_storage.save(new_filename, ContentFile(new_image.getvalue()))
         default_storage.delete(self.image.name)
         self.image.name = new_name
         if save:
@@ -1099,7 +1244,7 @@ class BadgeInstance(BaseAuditedModel,
                 'badge_id': self.entity_id,
                 'badge_description': self.badgeclass.description,
                 'help_email': getattr(settings, 'HELP_EMAIL', 'help@badgr.io'),
-                'issuer_name': re.sub(r'[^\w\s]+', '', self.issuer.name, 0, re.I),
+                'issuer_name': _NAME_SCRUB_RE.sub('', self.issuer.name),
                 'issuer_url': self.issuer.url,
                 'issuer_email': self.issuer.email,
                 'issuer_detail': self.issuer.public_url,
@@ -1120,8 +1265,8 @@ class BadgeInstance(BaseAuditedModel,
             raise e
 
         template_name = 'issuer/email/notify_earner'
+        CachedEmailAddress = _badgeuser_model('CachedEmailAddress')
         try:
-            from badgeuser.models import CachedEmailAddress
             CachedEmailAddress.objects.get(email=self.recipient_identifier, verified=True)
             template_name = 'issuer/email/notify_account_holder'
             email_context['site_url'] = badgr_app.ui_login_redirect
@@ -1134,9 +1279,22 @@ class BadgeInstance(BaseAuditedModel,
     def get_extensions_manager(self):
         return self.badgeinstanceextension_set
 
+    @property
+    def recipient_identity_hash(self):
+        """
+        The salted sha256 recipient identity, memoized for as long as recipient_identifier and salt are unchanged.
+        """
+        cached = self.__dict__.get('_recipient_identity_hash_cache')
+        if cached is not None and cached[0] is self.recipient_identifier and cached[1] is self.salt:
+            return cached[2]
+        identity = generate_sha256_hashstring(self.recipient_identifier, self.salt)
+        self._recipient_identity_hash_cache = (self.recipient_identifier, self.salt, identity)
+        return identity
+
     @property
     def recipient_user(self):
-        from badgeuser.models import CachedEmailAddress, UserRecipientIdentifier
+        CachedEmailAddress = _badgeuser_model('CachedEmailAddress')
+        UserRecipientIdentifier = _badgeuser_model('UserRecipientIdentifier')
         try:
             email_address = CachedEmailAddress.cached.get(email=self.recipient_identifier)
             if email_address.verified:
@@ -1153,37 +1311,41 @@ class BadgeInstance(BaseAuditedModel,
 
     def get_json(self, obi_version=CURRENT_OBI_VERSION, expand_badgeclass=False, expand_issuer=False, include_extra=True, use_canonical_id=False):
         obi_version, context_iri = get_obi_context(obi_version)
+        assertion_id = add_obi_version_ifneeded(self.jsonld_id, obi_version)
 
-        json = OrderedDict([
-            ('@context', context_iri),
-            ('type', 'Assertion'),
-            ('id', add_obi_version_ifneeded(self.jsonld_id, obi_version)),
-            ('badge', add_obi_version_ifneeded(self.cached_badgeclass.jsonld_id, obi_version)),
-        ])
+        # resolved before the revoked shortcut so an assertion whose badgeclass is gone still raises DoesNotExist
+        badgeclass = self.cached_badgeclass
+
+        # a revoked assertion only reports its id and revocation, skip building the rest
+        if self.revoked:
+            return {
+                '@context': context_iri,
+                'type': 'Assertion',
+                'id': self.jsonld_id if use_canonical_id else assertion_id,
+                'revoked': self.revoked,
+                'revocationReason': self.revocation_reason if self.revocation_reason else "",
+            }
+
+        json = {
+            '@context': context_iri,
+            'type': 'Assertion',
+            'id': assertion_id,
+            'badge': add_obi_version_ifneeded(badgeclass.jsonld_id, obi_version),
+        }
 
         image_url = self.image_url(public=True)
         json['image'] = image_url
         if self.original_json:
-            image_info = self.get_original_json().get('image', None)
+            image_info = _parse_original_json(self).get('image', None)
             if isinstance(image_info, dict):
-                json['image'] = image_info
-                json['image']['id'] = image_url
+                json['image'] = dict(copy.deepcopy(image_info), id=image_url)
 
         if expand_badgeclass:
-            json['badge'] = self.cached_badgeclass.get_json(obi_version=obi_version, include_extra=include_extra)
+            json['badge'] = badgeclass.get_json(obi_version=obi_version, include_extra=include_extra)
 
             if expand_issuer:
                 json['badge']['issuer'] = self.cached_issuer.get_json(obi_version=obi_version, include_extra=include_extra)
 
-        if self.revoked:
-            return OrderedDict([
-                ('@context', context_iri),
-                ('type', 'Assertion'),
-                ('id', self.jsonld_id if use_canonical_id else add_obi_version_ifneeded(self.jsonld_id, obi_version)),
-                ('revoked', self.revoked),
-                ('revocationReason', self.revocation_reason if self.revocation_reason else "")
-            ])
-
         if obi_version == '1_1':
             json["uid"] = self.entity_id
             json["verify"] = {
@@ -1227,7 +1389,7 @@ class BadgeInstance(BaseAuditedModel,
             json['recipient'] = {
                 "hashed": True,
                 "type": self.recipient_type,
-                "identity": generate_sha256_hashstring(self.recipient_identifier, self.salt),
+                "identity": self.recipient_identity_hash,
             }
             if self.salt:
                 json['recipient']['salt'] = self.salt
@@ -1239,15 +1401,14 @@ class BadgeInstance(BaseAuditedModel,
             }
 
         # extensions
-        if len(self.cached_extensions()) > 0:
-            for extension in self.cached_extensions():
-                json[extension.name] = json_loads(extension.original_json)
+        for extension in self.cached_extensions():
+            json[extension.name] = extension.get_original_json()
 
         # pass through imported json
         if include_extra:
             extra = self.get_filtered_json()
             if extra is not None:
-                for k,v in list(extra.items()):
+                for k, v in extra.items():
                     if k not in json:
                         json[k] = v
 
@@ -1257,13 +1418,14 @@ class BadgeInstance(BaseAuditedModel,
     def json(self):
         return self.get_json()
 
-    def get_filtered_json(self, excluded_fields=('@context', 'id', 'type', 'uid', 'recipient', 'badge', 'issuedOn', 'image', 'evidence', 'narrative', 'revoked', 'revocationReason', 'verify', 'verification')):
+    def get_filtered_json(self, excluded_fields=frozenset(('@context', 'id', 'type', 'uid', 'recipient', 'badge', 'issuedOn', 'image', 'evidence', 'narrative', 'revoked', 'revocationReason', 'verify', 'verification'))):
         filtered = super(BadgeInstance, self).get_filtered_json(excluded_fields=excluded_fields)
         # Ensure that the expires date string is in the expected ISO-85601 UTC format
         if filtered is not None and filtered.get('expires', None) and not str(filtered.get('expires')).endswith('Z'):
             filtered['expires'] = parse_original_datetime(filtered['expires'])
         return filtered
 
+    @prefer_prefetched(lambda obj: obj.badgeinstanceevidence_set)
     @cachemodel.cached_method(auto_publish=True)
     def cached_evidence(self):
         return self.badgeinstanceevidence_set.all()
@@ -1288,6 +1450,7 @@ class BadgeInstance(BaseAuditedModel,
     def evidence_items(self, value):
         def _key(narrative, url):
             return '{}-{}'.format(narrative or '', url or '')
+        self.discard_prefetched()
         existing_evidence_idx = {_key(e.narrative, e.evidence_url): e for e in self.evidence_items}
         new_evidence_idx = {_key(v.get('narrative', None), v.get('evidence_url', None)): v for v in value}
 
@@ -1332,6 +1495,7 @@ class BadgeInstance(BaseAuditedModel,
                 expand_badgeclass=True,
                 include_extra=True
             )
+            from openbadges_bakery import bake
             badgeclass_name, ext = os.path.splitext(self.badgeclass.image.file.name)
             new_image = io.BytesIO()
             bake(image_file=self.cached_badgeclass.image.file,
@@ -1339,7 +1503,7 @@ class BadgeInstance(BaseAuditedModel,
                  output_file=new_image)
             baked_image.image.save(
                 name='assertion-{id}-{version}{ext}'.format(id=self.entity_id, ext=ext, version=obi_version),
-                content=ContentFile(new_image.read()),
+                content=ContentFile(new_image.getvalue()),
                 save=False
             )
             baked_image.save()
@@ -1388,7 +1552,7 @@ class BadgeInstanceEvidence(OriginalJsonMixin, cachemodel.CacheModel):
         return ret
 
     def get_json(self, obi_version=CURRENT_OBI_VERSION, include_context=False):
-        json = OrderedDict()
+        json = {}
         if include_context:
             obi_version, context_iri = get_obi_context(obi_version)
             json['@context'] = context_iri
@@ -1419,7 +1583,7 @@ class BadgeClassAlignment(OriginalJsonMixin, cachemodel.CacheModel):
         self.badgeclass.publish()
 
     def get_json(self, obi_version=CURRENT_OBI_VERSION, include_context=False):
-        json = OrderedDict()
+        json = {}
         if include_context:
             obi_version, context_iri = get_obi_context(obi_version)
             json['@context'] = context_iri
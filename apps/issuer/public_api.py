@@ -27,6 +27,7 @@ from . import utils
 from backpack.models import BackpackCollection
 from entity.api import VersionedObjectMixin, BaseEntityListView, UncachedPaginatedViewMixin
 from mainsite.models import BadgrApp
+from mainsite.urlutils import cached_reverse
 from mainsite.utils import (OriginSetting, set_url_query_params, first_node_match, fit_image_to_height,
                             convert_svg_to_png)
 from .serializers_v1 import BadgeClassSerializerV1, IssuerSerializerV1
@@ -289,7 +290,7 @@ class IssuerJson(JSONComponentView):
     def get_context_data(self, **kwargs):
         image_url = "{}{}?type=png".format(
             OriginSetting.HTTP,
-            reverse('issuer_image', kwargs={'entity_id': self.current_object.entity_id})
+            cached_reverse('issuer_image', self.current_object.entity_id)
         )
         if self.is_wide_bot():
             image_url = "{}&fmt=wide".format(image_url)
@@ -355,7 +356,7 @@ class BadgeClassJson(JSONComponentView):
     def get_context_data(self, **kwargs):
         image_url = "{}{}?type=png".format(
             OriginSetting.HTTP,
-            reverse('badgeclass_image', kwargs={'entity_id': self.current_object.entity_id})
+            cached_reverse('badgeclass_image', self.current_object.entity_id)
         )
         if self.is_wide_bot():
             image_url = "{}&fmt=wide".format(image_url)
@@ -425,7 +426,7 @@ class BadgeInstanceJson(JSONComponentView):
     def get_context_data(self, **kwargs):
         image_url = "{}{}?type=png".format(
             OriginSetting.HTTP,
-            reverse('badgeclass_image', kwargs={'entity_id': self.current_object.cached_badgeclass.entity_id})
+            cached_reverse('badgeclass_image', self.current_object.cached_badgeclass.entity_id)
         )
         if self.is_wide_bot():
             image_url = "{}&fmt=wide".format(image_url)
@@ -471,7 +472,7 @@ class BackpackCollectionJson(JSONComponentView):
             chosen_assertion = sorted(self.current_object.cached_badgeinstances(), key=lambda b: b.issued_on)[0]
             image_url = "{}{}?type=png".format(
                 OriginSetting.HTTP,
-                reverse('badgeinstance_image', kwargs={'entity_id': chosen_assertion.entity_id})
+                cached_reverse('badgeinstance_image', chosen_assertion.entity_id)
             )
             if self.is_wide_bot():
                 image_url = "{}&fmt=wide".format(image_url)
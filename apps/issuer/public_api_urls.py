@@ -1,33 +1,51 @@
-from django.conf.urls import url
+from django.urls import path
 from django.views.decorators.clickjacking import xframe_options_exempt
 from rest_framework.urlpatterns import format_suffix_patterns
 
+from mainsite.urlutils import precompile_urlpatterns
+
 from .public_api import (IssuerJson, IssuerList, IssuerBadgesJson, IssuerImage, BadgeClassJson,BadgeClassList,
                          BadgeClassImage, BadgeClassCriteria, BadgeInstanceJson,
                          BadgeInstanceImage, BackpackCollectionJson, BakedBadgeInstanceImage,
                          OEmbedAPIEndpoint, VerifyBadgeAPIEndpoint)
 
+
+def _public_view(view_class):
+    """
+    The embeddable view for a public object that may also be requested by its legacy slug
+    """
+    return xframe_options_exempt(view_class.as_view(slugToEntityIdRedirect=True))
+
+
 json_patterns = [
-    url(r'^issuers/(?P<entity_id>[^/.]+)$', xframe_options_exempt(IssuerJson.as_view(slugToEntityIdRedirect=True)), name='issuer_json'),
-    url(r'^issuers/(?P<entity_id>[^/.]+)/badges$', xframe_options_exempt(IssuerBadgesJson.as_view(slugToEntityIdRedirect=True)), name='issuer_badges_json'),
-    url(r'^all-issuers$', xframe_options_exempt(IssuerList.as_view()), name='issuer_list_json'),
-    url(r'^badges/(?P<entity_id>[^/.]+)$', xframe_options_exempt(BadgeClassJson.as_view(slugToEntityIdRedirect=True)), name='badgeclass_json'),
-    url(r'^all-badges$', xframe_options_exempt(BadgeClassList.as_view()), name='badgeclass_list_json'),
-    url(r'^assertions/(?P<entity_id>[^/.]+)$', xframe_options_exempt(BadgeInstanceJson.as_view(slugToEntityIdRedirect=True)), name='badgeinstance_json'),
+    # issuer_json, badgeclass_json and badgeinstance_json are also formatted directly in issuer.models, keep in sync
+    path('issuers/<slug:entity_id>', _public_view(IssuerJson), name='issuer_json'),
+    path('issuers/<slug:entity_id>/badges', _public_view(IssuerBadgesJson), name='issuer_badges_json'),
+    path('all-issuers', xframe_options_exempt(IssuerList.as_view()), name='issuer_list_json'),
+    path('badges/<slug:entity_id>', _public_view(BadgeClassJson), name='badgeclass_json'),
+    path('all-badges', xframe_options_exempt(BadgeClassList.as_view()), name='badgeclass_list_json'),
+    path('assertions/<slug:entity_id>', _public_view(BadgeInstanceJson), name='badgeinstance_json'),
 
-    url(r'^collections/(?P<entity_id>[^/.]+)$', xframe_options_exempt(BackpackCollectionJson.as_view(slugToEntityIdRedirect=True)), name='collection_json'),
+    path('collections/<slug:entity_id>', _public_view(BackpackCollectionJson), name='collection_json'),
 
-    url(r'^oembed$', OEmbedAPIEndpoint.as_view(), name='oembed_api_endpoint'),
+    path('oembed', OEmbedAPIEndpoint.as_view(), name='oembed_api_endpoint'),
 
-    url(r'^verify$', VerifyBadgeAPIEndpoint.as_view(), name='verify_badge_api_endpoint')
+    path('verify', VerifyBadgeAPIEndpoint.as_view(), name='verify_badge_api_endpoint')
 ]
 
 image_patterns = [
-    url(r'^issuers/(?P<entity_id>[^/]+)/image$', IssuerImage.as_view(slugToEntityIdRedirect=True), name='issuer_image'),
-    url(r'^badges/(?P<entity_id>[^/]+)/image', BadgeClassImage.as_view(slugToEntityIdRedirect=True), name='badgeclass_image'),
-    url(r'^badges/(?P<entity_id>[^/]+)/criteria', BadgeClassCriteria.as_view(slugToEntityIdRedirect=True), name='badgeclass_criteria'),
-    url(r'^assertions/(?P<entity_id>[^/]+)/image', BadgeInstanceImage.as_view(slugToEntityIdRedirect=True), name='badgeinstance_image'),
-    url(r'^assertions/(?P<entity_id>[^/]+)/baked', BakedBadgeInstanceImage.as_view(slugToEntityIdRedirect=True), name='badgeinstance_bakedimage'),
+    path('issuers/<slug:entity_id>/image', IssuerImage.as_view(slugToEntityIdRedirect=True), name='issuer_image'),
+    path('badges/<slug:entity_id>/image', BadgeClassImage.as_view(slugToEntityIdRedirect=True), name='badgeclass_image'),
+    path('badges/<slug:entity_id>/criteria', BadgeClassCriteria.as_view(slugToEntityIdRedirect=True), name='badgeclass_criteria'),
+    path('assertions/<slug:entity_id>/image', BadgeInstanceImage.as_view(slugToEntityIdRedirect=True), name='badgeinstance_image'),
+    path('assertions/<slug:entity_id>/baked', BakedBadgeInstanceImage.as_view(slugToEntityIdRedirect=True), name='badgeinstance_bakedimage'),
 ]
 
-urlpatterns = format_suffix_patterns(json_patterns, allowed=['json']) + image_patterns
+# the .json variants get their own names so reverse() has a single candidate per name
+json_suffix_patterns = format_suffix_patterns(json_patterns, suffix_required=True, allowed=['json'])
+for urlpattern in json_suffix_patterns:
+    urlpattern.name = '{}_format_suffix'.format(urlpattern.name)
+
+urlpatterns = json_patterns + json_suffix_patterns + image_patterns
+
+precompile_urlpatterns(urlpatterns)
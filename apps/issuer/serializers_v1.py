@@ -8,7 +8,6 @@ import logging
 
 
 from django.core.exceptions import ValidationError as DjangoValidationError
-from django.urls import reverse
 from django.core.validators import EmailValidator, URLValidator
 from django.db.models import Q
 from django.utils.html import strip_tags
@@ -22,7 +21,6 @@ from mainsite.drf_fields import ValidImageField
 from mainsite.models import BadgrApp
 from mainsite.serializers import DateTimeWithUtcZAtEndField, HumanReadableBooleanField, StripTagsCharField, MarkdownCharField, \
     OriginalJsonSerializerMixin
-from mainsite.utils import OriginSetting
 from mainsite.exceptions import BadgrValidationError, BadgrValidationFieldError
 from mainsite.validators import ChoicesValidator, BadgeExtensionValidator, PositiveIntegerValidator, TelephoneValidator
 from .models import Issuer, BadgeClass, IssuerStaff, BadgeInstance, BadgeClassExtension, RECIPIENT_TYPE_EMAIL, RECIPIENT_TYPE_ID, RECIPIENT_TYPE_URL
@@ -256,7 +254,7 @@ class BadgeClassSerializerV1(OriginalJsonSerializerMixin, ExtensionsSaverMixin,
     def to_representation(self, instance):
         representation = super(BadgeClassSerializerV1, self).to_representation(instance)
         representation['issuerName'] = instance.cached_issuer.name
-        representation['issuer'] = OriginSetting.HTTP+reverse('issuer_json', kwargs={'entity_id': instance.cached_issuer.entity_id})
+        representation['issuer'] = instance.cached_issuer.public_url
         representation['json'] = instance.get_json(obi_version='1_1', use_canonical_id=True)
         return representation
 
@@ -479,13 +477,13 @@ class BadgeInstanceSerializerV1(OriginalJsonSerializerMixin, serializers.Seriali
         if self.context.get('include_issuer', False):
             representation['issuer'] = IssuerSerializerV1(instance.cached_badgeclass.cached_issuer).data
         else:
-            representation['issuer'] = OriginSetting.HTTP+reverse('issuer_json', kwargs={'entity_id': instance.cached_issuer.entity_id})
+            representation['issuer'] = instance.cached_issuer.public_url
         if self.context.get('include_badge_class', False):
             representation['badge_class'] = BadgeClassSerializerV1(instance.cached_badgeclass, context=self.context).data
         else:
-            representation['badge_class'] = OriginSetting.HTTP+reverse('badgeclass_json', kwargs={'entity_id': instance.cached_badgeclass.entity_id})
+            representation['badge_class'] = instance.cached_badgeclass.public_url
 
-        representation['public_url'] = OriginSetting.HTTP+reverse('badgeinstance_json', kwargs={'entity_id': instance.entity_id})
+        representation['public_url'] = instance.public_url
 
         return representation
 
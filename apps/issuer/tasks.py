@@ -322,6 +322,53 @@ def resend_notifications(self, badgeinstance_entity_ids):
     }
 
 
+@app.task(bind=True, queue=background_task_queue_name)
+def notify_admins_of_new_issuer(self, issuer_pk):
+    try:
+        issuer = Issuer.objects.get(pk=issuer_pk)
+    except Issuer.DoesNotExist:
+        return {
+            'success': False,
+            'message': "Issuer pk={} no longer exists".format(issuer_pk)
+        }
+
+    issuer.notify_admins()
+
+    return {
+        'success': True,
+        'message': "Notified admins of new issuer pk={}".format(issuer_pk)
+    }
+
+
+@app.task(bind=True, queue=background_task_queue_name, max_retries=10)
+def geocode_issuer_address(self, issuer_pk, address):
+    # geopy is only needed here, keep it out of every process that imports issuer.tasks
+    from geopy.exc import GeocoderServiceError
+    from geopy.geocoders import Nominatim
+
+    try:
+        geoloc = Nominatim(user_agent="myBadges").geocode(address)
+    except GeocoderServiceError as e:
+        raise self.retry(exc=e, countdown=2 ** self.request.retries)
+    if not geoloc:
+        return {
+            'success': False,
+            'message': "No location found for issuer pk={}".format(issuer_pk)
+        }
+
+    # update() rather than save() so that storing the coordinates doesn't trigger another geocode
+    Issuer.objects.filter(pk=issuer_pk).update(lat=geoloc.latitude, lon=geoloc.longitude)
+    try:
+        Issuer.objects.get(pk=issuer_pk).publish(publish_staff=False)
+    except Issuer.DoesNotExist:
+        pass
+
+    return {
+        'success': True,
+        'message': "Geocoded address for issuer pk={}".format(issuer_pk)
+    }
+
+
 @app.task(bind=True, queue=background_task_queue_name)
 def generate_png_preview_image(self, entity_id, entity_type):
     # Get instance of entity we are creating PNG preview for
@@ -16,11 +16,11 @@ from urllib.parse import quote_plus
 from django.core import mail
 from django.urls import reverse
 from django.utils import timezone
-from django.test import override_settings
+from django.test import override_settings, SimpleTestCase
 from oauth2_provider.models import Application
 
 from badgeuser.models import CachedEmailAddress, UserRecipientIdentifier
-from issuer.models import BadgeInstance, EmailBlacklist, IssuerStaff, Issuer
+from issuer.models import BadgeInstance, EmailBlacklist, IssuerStaff, Issuer, _parse_original_json
 from issuer.utils import parse_original_datetime
 from mainsite.tests import BadgrTestCase, SetupIssuerHelper, SetupOAuth2ApplicationHelper
 from mainsite.utils import OriginSetting, hash_for_image
@@ -1669,3 +1669,39 @@ class AllowDuplicatesAPITests(SetupIssuerHelper, BadgrTestCase):
         cached_assertion = BadgeInstance.cached.get(entity_id=assertion.entity_id)
         self.assertIsNone(cached_assertion._state.fields_cache.get('badgeclass'))
         self.assertIsNone(cached_assertion._state.fields_cache.get('issuer'))
+
+
+class OriginalJsonMemoTests(SimpleTestCase):
+    def setUp(self):
+        self.assertion = BadgeInstance(original_json=json.dumps({
+            'expires': '2030-01-01T00:00:00',
+            'extra': {'nested': ['value']},
+        }))
+
+    def test_memos_are_not_pickled(self):
+        _parse_original_json(self.assertion)
+        self.assertion.recipient_identity_hash
+
+        state = self.assertion.__getstate__()
+        self.assertNotIn('_original_json_cache', state)
+        self.assertNotIn('_recipient_identity_hash_cache', state)
+        self.assertIn('_original_json_cache', self.assertion.__dict__)
+
+    def test_returned_json_is_not_shared(self):
+        filtered = self.assertion.get_filtered_json()
+        self.assertTrue(filtered['expires'].endswith('Z'))
+        filtered['extra']['nested'].append('changed')
+        self.assertNotIn('_filtered_json_cache', self.assertion.__dict__)
+
+        original = self.assertion.get_original_json()
+        self.assertEqual(original['expires'], '2030-01-01T00:00:00')
+        self.assertEqual(original['extra'], {'nested': ['value']})
+        original['extra']['nested'].append('changed')
+
+        self.assertEqual(self.assertion.get_filtered_json()['extra'], {'nested': ['value']})
+
+    def test_get_original_json_returns_a_fresh_parse(self):
+        original = self.assertion.get_original_json()
+        self.assertIsNot(original, self.assertion.get_original_json())
+        self.assertEqual(original, _parse_original_json(self.assertion))
+        self.assertIsNone(BadgeInstance(original_json='not json').get_original_json())
@@ -1378,6 +1378,45 @@ class BadgeClassTests(SetupIssuerHelper, BadgrTestCase):
         self.assertEqual(response4.data.get("criteria_text", None), 'Description')
         self.assertEqual(response4.data.get("criteria_url", None), None)
 
+    def test_tag_items_setter(self):
+        test_user = self.setup_user(authenticate=False)
+        test_issuer = self.setup_issuer(owner=test_user)
+        test_badgeclass = self.setup_badgeclass(issuer=test_issuer)
+        self.assertEqual(list(test_badgeclass.cached_tags()), [])
+
+        test_badgeclass.tag_items = ['one', 'two', 'two']
+        self.assertEqual(sorted(t.name for t in test_badgeclass.cached_tags()), ['one', 'two'])
+        self.assertEqual(sorted(t.name for t in BadgeClass.cached.get(pk=test_badgeclass.pk).cached_tags()), ['one', 'two'])
+
+        test_badgeclass.tag_items = ['two', 'three']
+        self.assertEqual(sorted(t.name for t in test_badgeclass.cached_tags()), ['three', 'two'])
+        self.assertEqual(sorted(test_badgeclass.badgeclasstag_set.values_list('name', flat=True)), ['three', 'two'])
+
+        test_badgeclass.tag_items = None
+        self.assertEqual(list(test_badgeclass.cached_tags()), [])
+        self.assertFalse(test_badgeclass.badgeclasstag_set.exists())
+
+    def test_alignment_items_setter(self):
+        test_user = self.setup_user(authenticate=False)
+        test_issuer = self.setup_issuer(owner=test_user)
+        test_badgeclass = self.setup_badgeclass(issuer=test_issuer)
+        first = {'target_name': 'First', 'target_url': 'http://example.com/1'}
+        second = {'target_name': 'Second', 'target_url': 'http://example.com/2', 'target_code': '2'}
+
+        test_badgeclass.alignment_items = [first, second]
+        self.assertEqual(sorted(a.target_name for a in test_badgeclass.cached_alignments()), ['First', 'Second'])
+        self.assertEqual(
+            sorted(a.target_name for a in BadgeClass.cached.get(pk=test_badgeclass.pk).cached_alignments()),
+            ['First', 'Second'])
+
+        test_badgeclass.alignment_items = [second]
+        self.assertEqual([a.target_code for a in test_badgeclass.cached_alignments()], ['2'])
+        self.assertEqual(test_badgeclass.badgeclassalignment_set.count(), 1)
+
+        test_badgeclass.alignment_items = []
+        self.assertEqual(list(test_badgeclass.cached_alignments()), [])
+        self.assertFalse(test_badgeclass.badgeclassalignment_set.exists())
+
 
 class BadgeClassesChangedApplicationTests(SetupIssuerHelper, BadgrTestCase):
     def test_application_can_get_changed_badgeclasses(self):
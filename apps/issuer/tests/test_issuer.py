@@ -628,6 +628,65 @@ class IssuerTests(SetupOAuth2ApplicationHelper, SetupIssuerHelper, BadgrTestCase
 
         self.assertEqual(post_response.status_code, 400)
 
+    def _staff_roles(self, issuer):
+        return {s.user_id: s.role for s in issuer.cached_issuerstaff()}
+
+    def test_staff_items_setter(self):
+        owner = self.setup_user(authenticate=False)
+        test_issuer = self.setup_issuer(owner=owner)
+        editor = self.setup_user(authenticate=False)
+        staff = self.setup_user(authenticate=False)
+        self.assertEqual(self._staff_roles(test_issuer), {owner.pk: IssuerStaff.ROLE_OWNER})
+
+        # add
+        test_issuer.staff_items = [
+            {'cached_user': owner, 'role': IssuerStaff.ROLE_OWNER},
+            {'cached_user': editor, 'role': IssuerStaff.ROLE_EDITOR},
+            {'cached_user': staff, 'role': IssuerStaff.ROLE_STAFF},
+        ]
+        expected = {owner.pk: IssuerStaff.ROLE_OWNER, editor.pk: IssuerStaff.ROLE_EDITOR, staff.pk: IssuerStaff.ROLE_STAFF}
+        self.assertEqual(self._staff_roles(test_issuer), expected)
+        self.assertEqual(self._staff_roles(Issuer.cached.get(pk=test_issuer.pk)), expected)
+        self.assertEqual({s.user_id: s.role for s in IssuerStaff.objects.filter(issuer=test_issuer)}, expected)
+
+        # update a role and remove a member
+        test_issuer.staff_items = [
+            {'cached_user': owner, 'role': IssuerStaff.ROLE_OWNER},
+            {'cached_user': editor, 'role': IssuerStaff.ROLE_OWNER},
+        ]
+        expected = {owner.pk: IssuerStaff.ROLE_OWNER, editor.pk: IssuerStaff.ROLE_OWNER}
+        self.assertEqual(self._staff_roles(test_issuer), expected)
+        self.assertEqual(self._staff_roles(Issuer.cached.get(pk=test_issuer.pk)), expected)
+        self.assertEqual({s.user_id: s.role for s in IssuerStaff.objects.filter(issuer=test_issuer)}, expected)
+        self.assertEqual(test_issuer.owners.count(), 2)
+
+        # remove an owner, one is left
+        test_issuer.staff_items = [
+            {'cached_user': editor, 'role': IssuerStaff.ROLE_OWNER},
+        ]
+        self.assertEqual(self._staff_roles(test_issuer), {editor.pk: IssuerStaff.ROLE_OWNER})
+
+    def test_staff_items_setter_keeps_the_last_owner(self):
+        owner = self.setup_user(authenticate=False)
+        test_issuer = self.setup_issuer(owner=owner)
+        editor = self.setup_user(authenticate=False)
+
+        # the only owner is not removed
+        test_issuer.staff_items = [
+            {'cached_user': editor, 'role': IssuerStaff.ROLE_EDITOR},
+        ]
+        expected = {owner.pk: IssuerStaff.ROLE_OWNER, editor.pk: IssuerStaff.ROLE_EDITOR}
+        self.assertEqual(self._staff_roles(test_issuer), expected)
+        self.assertEqual(self._staff_roles(Issuer.cached.get(pk=test_issuer.pk)), expected)
+
+        # nor demoted
+        test_issuer.staff_items = [
+            {'cached_user': owner, 'role': IssuerStaff.ROLE_STAFF},
+            {'cached_user': editor, 'role': IssuerStaff.ROLE_EDITOR},
+        ]
+        self.assertEqual(self._staff_roles(test_issuer), expected)
+        self.assertEqual({s.user_id: s.role for s in IssuerStaff.objects.filter(issuer=test_issuer)}, expected)
+
     def test_delete_issuer_successfully(self):
         test_user = self.setup_user(authenticate=True)
         test_issuer = self.setup_issuer(owner=test_user)
@@ -836,6 +895,28 @@ class IssuerTests(SetupOAuth2ApplicationHelper, SetupIssuerHelper, BadgrTestCase
         self.assertEqual(response4.data['result'][0]['image'], None)
         self.assertEqual(response4.data['result'][1]['image'], None)
 
+    def test_prefetched_relations_are_discarded_on_write(self):
+        test_user = self.setup_user(authenticate=False)
+        test_issuer = self.setup_issuer(owner=test_user)
+
+        issuer = Issuer.objects.with_json_prefetch().get(pk=test_issuer.pk)
+        self.assertEqual(list(issuer.cached_extensions()), [])
+        self.assertIn('_prefetched_objects_cache', issuer.__dict__)
+
+        issuer.extension_items = {
+            'extensions:ExampleExtension': {
+                '@context': 'https://openbadgespec.org/extensions/exampleExtension/context.json',
+                'type': ['Extension', 'extensions:ExampleExtension'],
+                'exampleProperty': 'some value'
+            }
+        }
+        self.assertNotIn('_prefetched_objects_cache', issuer.__dict__)
+        self.assertEqual([e.name for e in issuer.cached_extensions()], ['extensions:ExampleExtension'])
+
+        issuer = Issuer.objects.with_json_prefetch().get(pk=test_issuer.pk)
+        issuer.save()
+        self.assertNotIn('_prefetched_objects_cache', issuer.__dict__)
+
 
 class IssuersChangedApplicationTests(SetupIssuerHelper, BadgrTestCase):
     def test_application_can_get_changed_issuers(self):
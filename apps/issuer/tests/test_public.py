@@ -9,6 +9,7 @@ from PIL import Image
 import responses
 
 from django.core.files.base import ContentFile
+from django.test import SimpleTestCase
 from django.urls import reverse
 from openbadges.verifier.openbadges_context import OPENBADGES_CONTEXT_V1_URI, OPENBADGES_CONTEXT_V2_URI, \
     OPENBADGES_CONTEXT_V2_DICT
@@ -55,6 +56,19 @@ class PublicAPITests(SetupIssuerHelper, BadgrTestCase):
             response = self.client.get('/public/badges/{}/image'.format(test_badgeclass.entity_id))
             self.assertEqual(response.status_code, 302)
 
+    def test_image_routes_do_not_match_longer_paths(self):
+        test_user = self.setup_user(authenticate=False)
+        test_issuer = self.setup_issuer(owner=test_user)
+        test_badgeclass = self.setup_badgeclass(issuer=test_issuer)
+        assertion = test_badgeclass.issue(recipient_id='new.recipient@email.test')
+
+        for path in ('/public/badges/{}/imagefoo'.format(test_badgeclass.entity_id),
+                     '/public/badges/{}/criteria/extra'.format(test_badgeclass.entity_id),
+                     '/public/assertions/{}/imagefoo'.format(assertion.entity_id),
+                     '/public/assertions/{}/bakedfoo'.format(assertion.entity_id)):
+            response = self.client.get(path)
+            self.assertEqual(response.status_code, 404, path)
+
     def test_get_badgeclass_image_wide(self):
         test_user = self.setup_user(authenticate=False)
         test_issuer = self.setup_issuer(owner=test_user)
@@ -95,7 +109,7 @@ class PublicAPITests(SetupIssuerHelper, BadgrTestCase):
         test_badgeclass = self.setup_badgeclass(issuer=test_issuer)
         assertion = test_badgeclass.issue(recipient_id='new.recipient@email.test')
 
-        with self.assertNumQueries(1):
+        with self.assertNumQueries(0):
             response = self.client.get('/public/assertions/{}'.format(assertion.entity_id),
                                        **{'HTTP_ACCEPT': 'application/json'})
             self.assertEqual(response.status_code, 200)
@@ -112,7 +126,7 @@ class PublicAPITests(SetupIssuerHelper, BadgrTestCase):
         test_badgeclass = self.setup_badgeclass(issuer=test_issuer)
         assertion = test_badgeclass.issue(recipient_id='new.recipient@email.test')
 
-        with self.assertNumQueries(1):
+        with self.assertNumQueries(0):
             response = self.client.get('/public/assertions/{}'.format(assertion.entity_id))
             self.assertEqual(response.status_code, 200)
 
@@ -267,13 +281,13 @@ class PublicAPITests(SetupIssuerHelper, BadgrTestCase):
         assertion = test_badgeclass.issue(recipient_id='new.recipient@email.test')
 
         for headers in redirect_accepts:
-            with self.assertNumQueries(1):
+            with self.assertNumQueries(0):
                 response = self.client.get('/public/assertions/{}'.format(assertion.entity_id), **headers)
                 self.assertEqual(response.status_code, 302)
                 self.assertEqual(response.get('Location'), 'http://stuff.com/public/assertions/{}'.format(assertion.entity_id))
 
         for headers in json_accepts:
-            with self.assertNumQueries(1):
+            with self.assertNumQueries(0):
                 response = self.client.get('/public/assertions/{}'.format(assertion.entity_id), **headers)
                 self.assertEqual(response.status_code, 200)
                 self.assertEqual(response.get('Content-Type'), "application/ld+json")
@@ -364,6 +378,20 @@ class PublicAPITests(SetupIssuerHelper, BadgrTestCase):
         self.assertEqual(response.data.get('badge', {}).get('name', None), new_badgeclass_name)
 
 
+class PublicUrlTemplateTests(SimpleTestCase):
+    """
+    The public json urls formatted in issuer.models must match what reverse() produces for their routes
+    """
+    def test_templates_match_reverse(self):
+        entity_id = 'T8nYPiQQRGKG7-nXj0H4sA'
+        self.assertEqual(Issuer(entity_id=entity_id).get_absolute_url(),
+                         reverse('issuer_json', kwargs={'entity_id': entity_id}))
+        self.assertEqual(BadgeClass(entity_id=entity_id).get_absolute_url(),
+                         reverse('badgeclass_json', kwargs={'entity_id': entity_id}))
+        self.assertEqual(BadgeInstance(entity_id=entity_id).get_absolute_url(),
+                         reverse('badgeinstance_json', kwargs={'entity_id': entity_id}))
+
+
 class PendingAssertionsPublicAPITests(SetupIssuerHelper, BadgrTestCase):
     @responses.activate
     def test_pending_assertion_returns_404(self):
@@ -0,0 +1,102 @@
+# encoding: utf-8
+import mock
+from celery.exceptions import Retry
+from django.core import mail
+from django.core.mail import get_connection
+from geopy.exc import GeocoderServiceError
+
+from issuer.models import Issuer
+from issuer.tasks import geocode_issuer_address, notify_admins_of_new_issuer
+from mainsite.tests import BadgrTestCase, SetupIssuerHelper
+
+
+class GeocodeIssuerAddressTests(SetupIssuerHelper, BadgrTestCase):
+    address = 'Unter den Linden 1 10117 Berlin Deutschland'
+
+    def test_address_change_enqueues_geocoding(self):
+        test_issuer = self.setup_issuer(owner=self.setup_user())
+
+        with mock.patch('issuer.tasks.geocode_issuer_address.delay') as delay:
+            test_issuer.street = 'Unter den Linden'
+            test_issuer.streetnumber = '1'
+            test_issuer.zip = '10117'
+            test_issuer.city = 'Berlin'
+            test_issuer.save()
+
+            # saving again without an address change doesn't geocode again
+            test_issuer.name = 'Renamed Issuer'
+            test_issuer.save()
+
+        delay.assert_called_once_with(test_issuer.pk, self.address)
+
+    def test_updates_lat_lon(self):
+        test_issuer = self.setup_issuer(owner=self.setup_user())
+
+        with mock.patch('geopy.geocoders.Nominatim') as nominatim:
+            nominatim.return_value.geocode.return_value = mock.Mock(latitude=52.517, longitude=13.389)
+            result = geocode_issuer_address(test_issuer.pk, self.address)
+
+        self.assertTrue(result['success'])
+        nominatim.return_value.geocode.assert_called_once_with(self.address)
+        test_issuer.refresh_from_db()
+        self.assertEqual((test_issuer.lat, test_issuer.lon), (52.517, 13.389))
+        cached_issuer = Issuer.cached.get(pk=test_issuer.pk)
+        self.assertEqual((cached_issuer.lat, cached_issuer.lon), (52.517, 13.389))
+
+    def test_no_location_found(self):
+        test_issuer = self.setup_issuer(owner=self.setup_user())
+
+        with mock.patch('geopy.geocoders.Nominatim') as nominatim:
+            nominatim.return_value.geocode.return_value = None
+            result = geocode_issuer_address(test_issuer.pk, self.address)
+
+        self.assertFalse(result['success'])
+        test_issuer.refresh_from_db()
+        self.assertEqual((test_issuer.lat, test_issuer.lon), (None, None))
+
+    def test_retries_on_geocoder_service_error(self):
+        test_issuer = self.setup_issuer(owner=self.setup_user())
+        error = GeocoderServiceError('Service unavailable')
+
+        with mock.patch('geopy.geocoders.Nominatim') as nominatim, \
+                mock.patch.object(geocode_issuer_address, 'retry', side_effect=Retry()) as retry:
+            nominatim.return_value.geocode.side_effect = error
+            with self.assertRaises(Retry):
+                geocode_issuer_address(test_issuer.pk, self.address)
+
+        retry.assert_called_once_with(exc=error, countdown=1)
+        test_issuer.refresh_from_db()
+        self.assertEqual((test_issuer.lat, test_issuer.lon), (None, None))
+
+
+class NotifyAdminsOfNewIssuerTests(SetupIssuerHelper, BadgrTestCase):
+    def test_new_issuer_notifies_admins(self):
+        admin = self.setup_user()
+        admin.is_staff = True
+        admin.save()
+
+        self.setup_issuer(owner=self.setup_user())
+        self.assertEqual([m.to for m in mail.outbox], [[admin.email]])
+
+    def test_one_connection_per_batch(self):
+        admins = []
+        for i in range(3):
+            admin = self.setup_user()
+            admin.is_staff = True
+            admin.save()
+            admins.append(admin)
+        test_issuer = self.setup_issuer(owner=self.setup_user())
+        mail.outbox = []
+
+        with mock.patch('issuer.models.get_connection', wraps=get_connection) as get_connection_mock:
+            result = notify_admins_of_new_issuer(test_issuer.pk)
+
+        self.assertTrue(result['success'])
+        get_connection_mock.assert_called_once_with()
+        self.assertEqual(sorted(m.to[0] for m in mail.outbox), sorted(a.email for a in admins))
+        self.assertEqual(len({id(m.connection) for m in mail.outbox}), 1)
+
+    def test_unknown_issuer(self):
+        result = notify_admins_of_new_issuer(-1)
+        self.assertFalse(result['success'])
+        self.assertEqual(len(mail.outbox), 0)
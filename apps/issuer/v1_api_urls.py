@@ -1,25 +1,28 @@
-from django.conf.urls import url
+from django.urls import path
 
 from issuer.api import (IssuerList, IssuerDetail, IssuerBadgeClassList, BadgeClassDetail, BadgeInstanceList,
                         BadgeInstanceDetail, IssuerBadgeInstanceList, AllBadgeClassesList, BatchAssertionsIssue)
 from issuer.api_v1 import FindBadgeClassDetail, IssuerStaffList
+from mainsite.urlutils import precompile_urlpatterns
 
 urlpatterns = [
     # url(r'^$', RedirectView.as_view(url='/v1/issuer/issuers', permanent=False)),
 
-    url(r'^all-badges$', AllBadgeClassesList.as_view(), name='v1_api_issuer_all_badges_list'),
-    url(r'^all-badges/find$', FindBadgeClassDetail.as_view(), name='v1_api_find_badgeclass_by_identifier'),
+    path('all-badges', AllBadgeClassesList.as_view(), name='v1_api_issuer_all_badges_list'),
+    path('all-badges/find', FindBadgeClassDetail.as_view(), name='v1_api_find_badgeclass_by_identifier'),
 
-    url(r'^issuers$', IssuerList.as_view(), name='v1_api_issuer_list'),
-    url(r'^issuers/(?P<slug>[^/]+)$', IssuerDetail.as_view(), name='v1_api_issuer_detail'),
-    url(r'^issuers/(?P<slug>[^/]+)/staff$', IssuerStaffList.as_view(), name='v1_api_issuer_staff'),
+    path('issuers', IssuerList.as_view(), name='v1_api_issuer_list'),
+    path('issuers/<slug:slug>', IssuerDetail.as_view(), name='v1_api_issuer_detail'),
+    path('issuers/<slug:slug>/staff', IssuerStaffList.as_view(), name='v1_api_issuer_staff'),
 
-    url(r'^issuers/(?P<slug>[^/]+)/badges$', IssuerBadgeClassList.as_view(), name='v1_api_badgeclass_list'),
-    url(r'^issuers/(?P<issuerSlug>[^/]+)/badges/(?P<slug>[^/]+)$', BadgeClassDetail.as_view(), name='v1_api_badgeclass_detail'),
+    path('issuers/<slug:slug>/badges', IssuerBadgeClassList.as_view(), name='v1_api_badgeclass_list'),
+    path('issuers/<slug:issuerSlug>/badges/<slug:slug>', BadgeClassDetail.as_view(), name='v1_api_badgeclass_detail'),
 
-    url(r'^issuers/(?P<issuerSlug>[^/]+)/badges/(?P<slug>[^/]+)/batchAssertions$', BatchAssertionsIssue.as_view(), name='v1_api_badgeclass_batchissue'),
+    path('issuers/<slug:issuerSlug>/badges/<slug:slug>/batchAssertions', BatchAssertionsIssue.as_view(), name='v1_api_badgeclass_batchissue'),
 
-    url(r'^issuers/(?P<issuerSlug>[^/]+)/badges/(?P<slug>[^/]+)/assertions$', BadgeInstanceList.as_view(), name='v1_api_badgeinstance_list'),
-    url(r'^issuers/(?P<slug>[^/]+)/assertions$', IssuerBadgeInstanceList.as_view(), name='v1_api_issuer_instance_list'),
-    url(r'^issuers/(?P<issuerSlug>[^/]+)/badges/(?P<badgeSlug>[^/]+)/assertions/(?P<slug>[^/]+)$', BadgeInstanceDetail.as_view(), name='v1_api_badgeinstance_detail'),
+    path('issuers/<slug:issuerSlug>/badges/<slug:slug>/assertions', BadgeInstanceList.as_view(), name='v1_api_badgeinstance_list'),
+    path('issuers/<slug:slug>/assertions', IssuerBadgeInstanceList.as_view(), name='v1_api_issuer_instance_list'),
+    path('issuers/<slug:issuerSlug>/badges/<slug:badgeSlug>/assertions/<slug:slug>', BadgeInstanceDetail.as_view(), name='v1_api_badgeinstance_detail'),
 ]
+
+precompile_urlpatterns(urlpatterns)
@@ -1,27 +1,30 @@
-from django.conf.urls import url
+from django.urls import path
 
 from issuer.api import (IssuerList, IssuerDetail, IssuerBadgeClassList, BadgeClassDetail, BadgeInstanceList,
                         BadgeInstanceDetail, IssuerBadgeInstanceList, AllBadgeClassesList, BatchAssertionsIssue,
                         BatchAssertionsRevoke, IssuerTokensList, AssertionsChangedSince, BadgeClassesChangedSince,
                         IssuersChangedSince)
+from mainsite.urlutils import precompile_urlpatterns
 
 urlpatterns = [
 
-    url(r'^issuers$', IssuerList.as_view(), name='v2_api_issuer_list'),
-    url(r'^issuers/changed$', IssuersChangedSince.as_view(), name='v2_api_issuers_changed_list'),
-    url(r'^issuers/(?P<entity_id>[^/]+)$', IssuerDetail.as_view(), name='v2_api_issuer_detail'),
-    url(r'^issuers/(?P<entity_id>[^/]+)/assertions$', IssuerBadgeInstanceList.as_view(), name='v2_api_issuer_assertion_list'),
-    url(r'^issuers/(?P<entity_id>[^/]+)/badgeclasses$', IssuerBadgeClassList.as_view(), name='v2_api_issuer_badgeclass_list'),
+    path('issuers', IssuerList.as_view(), name='v2_api_issuer_list'),
+    path('issuers/changed', IssuersChangedSince.as_view(), name='v2_api_issuers_changed_list'),
+    path('issuers/<slug:entity_id>', IssuerDetail.as_view(), name='v2_api_issuer_detail'),
+    path('issuers/<slug:entity_id>/assertions', IssuerBadgeInstanceList.as_view(), name='v2_api_issuer_assertion_list'),
+    path('issuers/<slug:entity_id>/badgeclasses', IssuerBadgeClassList.as_view(), name='v2_api_issuer_badgeclass_list'),
 
-    url(r'^badgeclasses$', AllBadgeClassesList.as_view(), name='v2_api_badgeclass_list'),
-    url(r'^badgeclasses/changed$', BadgeClassesChangedSince.as_view(), name='v2_api_badgeclasses_changed_list'),
-    url(r'^badgeclasses/(?P<entity_id>[^/]+)$', BadgeClassDetail.as_view(), name='v2_api_badgeclass_detail'),
-    url(r'^badgeclasses/(?P<entity_id>[^/]+)/issue$', BatchAssertionsIssue.as_view(), name='v2_api_badgeclass_issue'),
-    url(r'^badgeclasses/(?P<entity_id>[^/]+)/assertions$', BadgeInstanceList.as_view(), name='v2_api_badgeclass_assertion_list'),
+    path('badgeclasses', AllBadgeClassesList.as_view(), name='v2_api_badgeclass_list'),
+    path('badgeclasses/changed', BadgeClassesChangedSince.as_view(), name='v2_api_badgeclasses_changed_list'),
+    path('badgeclasses/<slug:entity_id>', BadgeClassDetail.as_view(), name='v2_api_badgeclass_detail'),
+    path('badgeclasses/<slug:entity_id>/issue', BatchAssertionsIssue.as_view(), name='v2_api_badgeclass_issue'),
+    path('badgeclasses/<slug:entity_id>/assertions', BadgeInstanceList.as_view(), name='v2_api_badgeclass_assertion_list'),
 
-    url(r'^assertions/revoke$', BatchAssertionsRevoke.as_view(), name='v2_api_assertion_revoke'),
-    url(r'^assertions/changed$', AssertionsChangedSince.as_view(), name='v2_api_assertions_changed_list'),
-    url(r'^assertions/(?P<entity_id>[^/]+)$', BadgeInstanceDetail.as_view(), name='v2_api_assertion_detail'),
+    path('assertions/revoke', BatchAssertionsRevoke.as_view(), name='v2_api_assertion_revoke'),
+    path('assertions/changed', AssertionsChangedSince.as_view(), name='v2_api_assertions_changed_list'),
+    path('assertions/<slug:entity_id>', BadgeInstanceDetail.as_view(), name='v2_api_assertion_detail'),
 
-    url(r'^tokens/issuers$', IssuerTokensList.as_view(), name='v2_api_tokens_list'),
+    path('tokens/issuers', IssuerTokensList.as_view(), name='v2_api_tokens_list'),
 ]
+
+precompile_urlpatterns(urlpatterns)
@@ -26,7 +26,7 @@ class BadgrAccountAdapter(DefaultAccountAdapter):
 
     EMAIL_FROM_STRING = ''
 
-    def send_mail(self, template_prefix, email, context):
+    def send_mail(self, template_prefix, email, context, connection=None):
         context['STATIC_URL'] = getattr(settings, 'STATIC_URL')
         context['HTTP_ORIGIN'] = getattr(settings, 'HTTP_ORIGIN')
         context['PRIVACY_POLICY_URL'] = getattr(settings, 'PRIVACY_POLICY_URL', None)
@@ -47,6 +47,8 @@ class BadgrAccountAdapter(DefaultAccountAdapter):
         self.EMAIL_FROM_STRING = self.set_email_string(context)
 
         msg = self.render_mail(template_prefix, email, context)
+        if connection is not None:
+            msg.connection = connection
         logger.event(badgrlog.EmailRendered(msg))
         msg.send()
 
@@ -12,3 +12,14 @@ class BadgrConfig(AppConfig):
         if getattr(settings, 'BADGR_CORS_MODEL'):
             from mainsite.signals import cors_allowed_sites
             check_request_enabled.connect(cors_allowed_sites)
+
+        if getattr(settings, 'POPULATE_URLS_EAGERLY', False):
+            from django.urls import get_resolver
+            from django.utils import translation
+            resolver = get_resolver()
+            resolver.reverse_dict  # populates the resolver's lookup tables as a side effect
+            if settings.USE_I18N:
+                # the tables are built per active language
+                for language_code, _ in settings.LANGUAGES:
+                    with translation.override(language_code):
+                        resolver.reverse_dict
@@ -1,3 +1,4 @@
+import threading
 from hashlib import sha256
 
 import requests
@@ -6,6 +7,20 @@ from requests.exceptions import ConnectionError
 from django.conf import settings
 
 
+_local = threading.local()
+
+
+def _session():
+    """
+    A requests.Session per thread, so consecutive blacklist calls (e.g. batch issuing) reuse one keep-alive connection
+    instead of paying a TCP/TLS handshake per recipient.
+    """
+    session = getattr(_local, 'session', None)
+    if session is None:
+        session = _local.session = requests.Session()
+    return session
+
+
 def api_submit_recipient_id(id_type, recipient_id):
     blacklist_api_key = getattr(settings, 'BADGR_BLACKLIST_API_KEY', None)
     blacklist_query_endpoint = getattr(settings, 'BADGR_BLACKLIST_QUERY_ENDPOINT', None)
@@ -13,7 +28,7 @@ def api_submit_recipient_id(id_type, recipient_id):
         recipient_id_hash = generate_hash(id_type, recipient_id)
 
         try:
-            response = requests.post(
+            response = _session().post(
                 blacklist_query_endpoint, json={"id": recipient_id_hash}, headers={
                     "Authorization": "BEARER {api_key}".format(
                         api_key=blacklist_api_key
@@ -34,7 +49,7 @@ def api_query_recipient_id(id_type, recipient_id, blacklist_query_endpoint, blac
         recipient_id_hash=recipient_id_hash)
 
     try:
-        response = requests.get(request_query, headers={
+        response = _session().get(request_query, headers={
             "Authorization": "BEARER {api_key}".format(
                 api_key=blacklist_api_key
             ),
@@ -0,0 +1,46 @@
+"""
+loads/dumps that use orjson (pinned in requirements.txt) and fall back to the stdlib json module when it isn't
+installed.
+
+dumps() always returns a str. Without indent it is compact (no spaces after ',' and ':'); indent=2 maps onto orjson's
+OPT_INDENT_2, which produces the same layout as json.dumps(indent=2). Any other stdlib keyword arguments (sort_keys,
+separators, ...) are handed to json.dumps so existing output formatting is preserved. Values orjson refuses (non-str
+keys, integers wider than 64 bits) are encoded by json.dumps instead, and text orjson refuses (NaN/Infinity) is
+decoded by json.loads.
+
+Remaining differences from the stdlib: non-ASCII characters are emitted as UTF-8 instead of \\u escapes, NaN and
+Infinity are encoded as null, and integers wider than 64 bits are decoded as floats.
+"""
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+if orjson is not None:
+    def loads(s):
+        try:
+            return orjson.loads(s)
+        except orjson.JSONDecodeError:
+            return json.loads(s)
+
+    def dumps(obj, indent=None, **kwargs):
+        if kwargs or indent not in (None, 2):
+            return json.dumps(obj, indent=indent, **kwargs)
+        option = orjson.OPT_INDENT_2 if indent == 2 else 0
+        try:
+            return orjson.dumps(obj, option=option).decode('utf-8')
+        except TypeError:
+            if indent is None:
+                return json.dumps(obj, separators=(',', ':'))
+            return json.dumps(obj, indent=indent)
+else:
+    loads = json.loads
+
+    def dumps(obj, indent=None, **kwargs):
+        if indent is None and not kwargs:
+            # match the compact orjson output
+            return json.dumps(obj, separators=(',', ':'))
+        return json.dumps(obj, indent=indent, **kwargs)
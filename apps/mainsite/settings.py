@@ -75,6 +75,9 @@ MIDDLEWARE = [
 
 ROOT_URLCONF = 'mainsite.urls'
 
+# Build the url resolver's reverse lookup tables at startup instead of during the first request a worker serves
+POPULATE_URLS_EAGERLY = False
+
 # Hosts/domain names that are valid for this site.
 # "*" matches anything, ".example.com" matches example.com and all subdomains
 # ALLOWED_HOSTS = ['<your badgr server domain>', ]
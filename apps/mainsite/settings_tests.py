@@ -22,3 +22,6 @@ CELERY_ALWAYS_EAGER = True
 SECRET_KEY = 'aninsecurekeyusedfortesting'
 UNSUBSCRIBE_SECRET_KEY = str(SECRET_KEY)
 AUTHCODE_SECRET_KEY = Fernet.generate_key()
+
+# tests follow redirects to uploaded images, serve them without DEBUG
+DEBUG_MEDIA = True
@@ -32,3 +32,7 @@ logging.disable(logging.CRITICAL)
 CELERY_ALWAYS_EAGER = True
 CELERY_EAGER_PROPAGATES_EXCEPTIONS = True
 BROKER_BACKEND = 'memory'
+
+# serve uploads and static files without DEBUG
+DEBUG_MEDIA = True
+DEBUG_STATIC = True
@@ -0,0 +1,80 @@
+# encoding: utf-8
+import importlib.util
+import json
+import math
+import sys
+import unittest
+
+import mock
+from django.test import SimpleTestCase
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def load_json_compat(without_orjson=False):
+    """
+    A private copy of mainsite.json_compat, optionally imported as if orjson wasn't installed
+    """
+    with mock.patch.dict(sys.modules, {'orjson': None} if without_orjson else {}):
+        spec = importlib.util.find_spec('mainsite.json_compat')
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+    return module
+
+
+DOCUMENT = {
+    '@context': 'https://w3id.org/openbadges/v2',
+    'type': 'Assertion',
+    'id': 'http://localhost:8000/public/assertions/T8nYPiQQRGKG7-nXj0H4sA',
+    'recipient': {'hashed': True, 'type': 'email', 'identity': 'sha256$abc'},
+    'evidence': [{'narrative': 'Did the thing', 'id': None}, {}],
+    'extensions:exampleExtension': {'count': 3, 'ratio': 0.5, 'tags': []},
+}
+
+
+class JsonCompatTestsMixin(object):
+    compat = None
+
+    def test_indent_2_matches_stdlib(self):
+        self.assertEqual(self.compat.dumps(DOCUMENT, indent=2), json.dumps(DOCUMENT, indent=2))
+
+    def test_compact_output(self):
+        output = self.compat.dumps(DOCUMENT)
+        self.assertIsInstance(output, str)
+        self.assertEqual(output, json.dumps(DOCUMENT, separators=(',', ':')))
+        self.assertEqual(self.compat.loads(output), DOCUMENT)
+
+    def test_stdlib_kwargs_are_passed_through(self):
+        self.assertEqual(self.compat.dumps(DOCUMENT, sort_keys=True), json.dumps(DOCUMENT, sort_keys=True))
+        self.assertEqual(self.compat.dumps(DOCUMENT, indent=4), json.dumps(DOCUMENT, indent=4))
+
+    def test_non_str_keys_and_wide_ints(self):
+        self.assertEqual(self.compat.dumps({1: 'a'}), '{"1":"a"}')
+        self.assertEqual(self.compat.dumps({'a': 2 ** 70}), '{"a":%d}' % 2 ** 70)
+        self.assertEqual(self.compat.dumps({1: 'a'}, indent=2), json.dumps({1: 'a'}, indent=2))
+
+    def test_loads_nan(self):
+        self.assertTrue(math.isnan(self.compat.loads('{"a": NaN}')['a']))
+
+
+@unittest.skipIf(orjson is None, "orjson is not installed")
+class OrjsonJsonCompatTests(JsonCompatTestsMixin, SimpleTestCase):
+    compat = load_json_compat()
+
+    def test_uses_orjson(self):
+        self.assertIsNotNone(self.compat.orjson)
+
+    def test_orjson_differences(self):
+        self.assertEqual(self.compat.dumps({'a': float('nan')}), '{"a":null}')
+        self.assertEqual(self.compat.dumps({'name': 'Prüfung'}), '{"name":"Prüfung"}')
+
+
+class StdlibJsonCompatTests(JsonCompatTestsMixin, SimpleTestCase):
+    compat = load_json_compat(without_orjson=True)
+
+    def test_uses_stdlib(self):
+        self.assertIsNone(self.compat.orjson)
+        self.assertIs(self.compat.loads, json.loads)
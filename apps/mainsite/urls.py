@@ -22,9 +22,22 @@ from mainsite.views import (SitewideActionFormView, RedirectToUiLogin, DocsAutho
 from mainsite.views import info_view, email_unsubscribe, AppleAppSiteAssociation, error404, error500
 
 from mainsite.views import upload, nounproject
+from mainsite.urlutils import precompile_urlpatterns
+from badgeuser import v1_api_urls as badgeuser_v1_api_urls
+from badgrsocialauth import v1_api_urls as badgrsocialauth_v1_api_urls
+from issuer import v2_api_urls as issuer_v2_api_urls
+from badgeuser import v2_api_urls as badgeuser_v2_api_urls
+from badgrsocialauth import v2_api_urls as badgrsocialauth_v2_api_urls
 from django.conf.urls.static import static
 
 urlpatterns = [
+    # The resolver tries patterns in order, the most requested endpoints come first. Their prefixes don't overlap
+    # anything below, keep them first when adding routes.
+    url(r'^o/token/?$', TokenView.as_view(), name='oauth2_provider_token'),
+    url(r'^public/', include('issuer.public_api_urls'), kwargs={'version': 'v2'}),
+    url(r'^v2/', include(issuer_v2_api_urls.urlpatterns + badgeuser_v2_api_urls.urlpatterns +
+                         badgrsocialauth_v2_api_urls.urlpatterns), kwargs={'version': 'v2'}),
+
     # Backup URLs in case the server isn't serving these directly
     url(r'^favicon\.png[/]?$', RedirectView.as_view(url='%simages/favicon.png' % settings.STATIC_URL, permanent=True)),
     url(r'^favicon\.ico[/]?$', RedirectView.as_view(url='%simages/favicon.png' % settings.STATIC_URL, permanent=True)),
@@ -38,13 +51,12 @@ urlpatterns = [
 
     # OAuth2 provider URLs
     url(r'^o/authorize/?$', AuthorizationApiView.as_view(), name='oauth2_api_authorize'),
-    url(r'^o/token/?$', TokenView.as_view(), name='oauth2_provider_token'),
     url(r'^o/code/?$', AuthCodeExchange.as_view(), name='oauth2_code_exchange'),
     url(r'^o/register/?$', RegisterApiView.as_view(), kwargs={'version': 'rfc7591'}, name='oauth2_api_register'),
     path('o/', include('oauth2_provider.urls', namespace='oauth2_provider')),
 
     # Badge Connect URLs
-    url(r'^bcv1/manifest/(?P<domain>[^/]+)$', BadgeConnectManifestView.as_view(), name='badge_connect_manifest'),
+    path('bcv1/manifest/<str:domain>', BadgeConnectManifestView.as_view(), name='badge_connect_manifest'),
     url(r'^\.well-known/badgeconnect.json$', BadgeConnectManifestRedirectView.as_view(), name='default_bc_manifest_redirect'),
     url(r'^bcv1/', include('backpack.badge_connect_urls'), kwargs={'version': 'bcv1'}),
 
@@ -73,8 +85,6 @@ urlpatterns = [
     # unversioned public endpoints
     url(r'^unsubscribe/(?P<email_encoded>[^/]+)/(?P<expiration>[^/]+)/(?P<signature>[^/]+)', email_unsubscribe, name='unsubscribe'),
 
-    url(r'^public/', include('issuer.public_api_urls'), kwargs={'version': 'v2'}),
-
     # legacy share redirects
     url(r'', include('backpack.share_urls')),
 
@@ -85,18 +95,16 @@ urlpatterns = [
     url(r'^account/', include('badgrsocialauth.urls')),
 
     # v1 API endpoints
-    url(r'^v1/user/', include('badgeuser.v1_api_urls'), kwargs={'version': 'v1'}),
-    url(r'^v1/user/', include('badgrsocialauth.v1_api_urls'), kwargs={'version': 'v1'}),
+    url(r'^v1/user/', include(badgeuser_v1_api_urls.urlpatterns + badgrsocialauth_v1_api_urls.urlpatterns),
+        kwargs={'version': 'v1'}),
 
     url(r'^v1/issuer/', include('issuer.v1_api_urls'), kwargs={'version': 'v1'}),
     url(r'^v1/earner/', include('backpack.v1_api_urls'), kwargs={'version': 'v1'}),
 
 
     # v2 API endpoints
-    url(r'^v2/', include('issuer.v2_api_urls'), kwargs={'version': 'v2'}),
-    url(r'^v2/', include('badgeuser.v2_api_urls'), kwargs={'version': 'v2'}),
-    url(r'^v2/', include('badgrsocialauth.v2_api_urls'), kwargs={'version': 'v2'}),
     url(r'^v2/backpack/', include('backpack.v2_api_urls'), kwargs={'version': 'v2'}),
+    url(r'^v2/backpack/by-email/', include('backpack.v2_badges_from_user_urls'), kwargs={'version': 'v2'}),
 
 
     # External Tools
@@ -104,45 +112,50 @@ urlpatterns = [
     url(r'^v2/externaltools/', include('externaltools.v2_api_urls'), kwargs={'version': 'v2'}),
 
     url(r'^upload', upload, name="image_upload"),
-    url(r'^nounproject/(?P<searchterm>[^/]+)/(?P<page>[^/]+)$', nounproject, name="nounproject"),
+    path('nounproject/<str:searchterm>/<str:page>', nounproject, name="nounproject"),
 ]
 # add to serve files
 urlpatterns += static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
 
-# Test URLs to allow you to see these pages while DEBUG is True
-if getattr(settings, 'DEBUG_ERRORS', False):
-    urlpatterns = [
-        url(r'^error/404/$', error404, name='404'),
-        url(r'^error/500/$', error500, name='500'),
-    ] + urlpatterns
+# debug-only patterns go in front of everything else, build them in one list
+debug_urlpatterns = []
 
-# If DEBUG_MEDIA is set, have django serve anything in MEDIA_ROOT at MEDIA_URL
-if getattr(settings, 'DEBUG_MEDIA', True):
-    from django.views.static import serve as static_serve
-    media_url = getattr(settings, 'MEDIA_URL', '/media/').lstrip('/')
-    urlpatterns = [
-        url(r'^media/(?P<path>.*)$', static_serve, {
-            'document_root': settings.MEDIA_ROOT
-        }),
-    ] + urlpatterns
+# Serve pattern library view only in debug mode or if explicitly declared
+if getattr(settings, 'DEBUG', True) or getattr(settings, 'SERVE_PATTERN_LIBRARY', False):
+    debug_urlpatterns.append(
+        url(r'^component-library$', TemplateView.as_view(template_name='component-library.html'), name='component-library')
+    )
 
 # If DEBUG_STATIC is set, have django serve up static files even if DEBUG=False
-if getattr(settings, 'DEBUG_STATIC', True):
+if getattr(settings, 'DEBUG_STATIC', settings.DEBUG):
     from django.contrib.staticfiles.views import serve as staticfiles_serve
     static_url = getattr(settings, 'STATIC_URL', '/static/')
     static_url = static_url.replace(getattr(settings, 'HTTP_ORIGIN', 'http://localhost:8000'), '')
     static_url = static_url.lstrip('/')
-    urlpatterns = [
+    debug_urlpatterns.append(
         url(r'^%s(?P<path>.*)' % (static_url,), staticfiles_serve, kwargs={
             'insecure': True,
         })
-    ] + urlpatterns
+    )
 
-# Serve pattern library view only in debug mode or if explicitly declared
-if getattr(settings, 'DEBUG', True) or getattr(settings, 'SERVE_PATTERN_LIBRARY', False):
-    urlpatterns = [
-       url(r'^component-library$', TemplateView.as_view(template_name='component-library.html'), name='component-library')
-    ] + urlpatterns
+# If DEBUG_MEDIA is set, have django serve anything in MEDIA_ROOT at MEDIA_URL
+if getattr(settings, 'DEBUG_MEDIA', settings.DEBUG):
+    from django.views.static import serve as static_serve
+    media_url = getattr(settings, 'MEDIA_URL', '/media/').lstrip('/')
+    debug_urlpatterns.append(
+        url(r'^media/(?P<path>.*)$', static_serve, {
+            'document_root': settings.MEDIA_ROOT
+        })
+    )
+
+# Test URLs to allow you to see these pages while DEBUG is True
+if getattr(settings, 'DEBUG_ERRORS', False):
+    debug_urlpatterns += [
+        url(r'^error/404/$', error404, name='404'),
+        url(r'^error/500/$', error500, name='500'),
+    ]
+
+urlpatterns = debug_urlpatterns + urlpatterns
 
 # serve django debug toolbar if present
 if settings.DEBUG and apps.is_installed('debug_toolbar'):
@@ -154,5 +167,7 @@ if settings.DEBUG and apps.is_installed('debug_toolbar'):
     except ImportError:
         pass
 
+precompile_urlpatterns(urlpatterns)
+
 handler404 = error404
 handler500 = error500
@@ -0,0 +1,48 @@
+"""
+Helpers for building the project's urlconfs.
+"""
+from functools import lru_cache
+
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from django.urls import get_script_prefix, reverse
+
+# compiled route regexes shared across every urlconf, keyed by pattern class and source string
+_compiled_regexes = {}
+
+
+def precompile_urlpatterns(urlpatterns):
+    """
+    Eagerly compile the regex of each pattern in urlpatterns instead of on the first request that resolves against it.
+    Identical patterns from different urlconfs (eg. 'assertions', 'profile') share a single compiled regex.
+    """
+    for urlpattern in urlpatterns:
+        pattern = urlpattern.pattern
+        source = getattr(pattern, '_route', getattr(pattern, '_regex', None))
+        if not isinstance(source, str):
+            # translatable patterns are compiled per-language by django
+            continue
+        key = (pattern.__class__, source, getattr(pattern, '_is_endpoint', True))
+        if key not in _compiled_regexes:
+            _compiled_regexes[key] = pattern.regex
+        pattern.__dict__['regex'] = _compiled_regexes[key]
+    return urlpatterns
+
+
+@lru_cache(maxsize=8192)
+def _reverse_entity(script_prefix, viewname, entity_id):
+    return reverse(viewname, kwargs={'entity_id': entity_id})
+
+
+def cached_reverse(viewname, entity_id):
+    """
+    reverse() for the public routes that only take an entity_id, memoized since the same objects are reversed over and
+    over while serializing. The script prefix is part of the key because reverse() includes it in the result.
+    """
+    return _reverse_entity(get_script_prefix(), viewname, entity_id)
+
+
+@receiver(setting_changed)
+def _clear_cached_reverse(setting, **kwargs):
+    if setting == 'ROOT_URLCONF':
+        _reverse_entity.cache_clear()
@@ -19,9 +19,13 @@ sys.path.insert(0, APPS_DIR)
 
 # load up django
 from django.core.wsgi import get_wsgi_application
+from health.wsgi_shortcut import HealthShortcut
 
 # tell django to find settings entry point'
 os.environ['DJANGO_SETTINGS_MODULE'] = 'mainsite.settings_local'
 
 # hand off to the wsgi application
 application = get_wsgi_application()
+
+# answer load balancer health checks without going through django's request handling
+application = HealthShortcut(application)